@@ -5,29 +5,45 @@ A beautiful TUI application for displaying Islamic prayer times
 """
 
 import os
+import re
 import sys
 import json
 import time
+import shutil
+import hashlib
 import argparse
 import subprocess
 import threading
 from pathlib import Path
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 try:
     from zoneinfo import ZoneInfo
 except ImportError:
     from backports.zoneinfo import ZoneInfo
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from adhan import PrayerTimes as LocalPrayerTimes, Coordinates, CalculationMethod
+except ImportError:
+    LocalPrayerTimes = None
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: 'requests' module not found. Install it with: pip install requests")
     sys.exit(1)
 
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.table import Table
     from rich.panel import Panel
     from rich.live import Live
@@ -39,6 +55,16 @@ except ImportError:
     sys.exit(1)
 
 
+PRAYERS = ('Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha')
+
+
+@lru_cache(maxsize=16)
+def _parse_hhmm(time_str: str) -> Tuple[int, int]:
+    """Parse an 'HH:MM' string into (hour, minute), memoized"""
+    hour, minute = time_str.split(':')
+    return int(hour), int(minute)
+
+
 # ============================================================================
 # Configuration Manager
 # ============================================================================
@@ -66,14 +92,12 @@ class ConfigManager:
     
     def load(self) -> Dict:
         """Load configuration from file"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    return {**self.DEFAULT_CONFIG, **config}
-            except Exception:
-                return self.DEFAULT_CONFIG.copy()
-        return self.DEFAULT_CONFIG.copy()
+        try:
+            raw = self.config_file.read_bytes()
+            config = orjson.loads(raw) if orjson else json.loads(raw)
+            return {**self.DEFAULT_CONFIG, **config}
+        except Exception:
+            return self.DEFAULT_CONFIG.copy()
     
     def save(self):
         """Save configuration to file"""
@@ -100,35 +124,219 @@ class PrayerTimesAPI:
     
     BASE_URL = "http://api.aladhan.com/v1"
     LOCATION_API = "http://ip-api.com/json/"
-    
+    CACHE_DIR = Path.home() / ".cache" / "adhan-live"
+
+    # Aladhan method id -> calculation method name in the optional
+    # local 'adhan' package (ids without a local equivalent fall back
+    # to the HTTP API)
+    LOCAL_METHODS = {
+        1: 'KARACHI',
+        2: 'NORTH_AMERICA',
+        3: 'MUSLIM_WORLD_LEAGUE',
+        4: 'UMM_AL_QURA',
+        5: 'EGYPTIAN',
+        9: 'KUWAIT',
+        10: 'QATAR',
+        11: 'SINGAPORE',
+        15: 'MOON_SIGHTING_COMMITTEE'
+    }
+
     def __init__(self, config: ConfigManager):
         self.config = config
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': 'AdhanLive/2.0'})
-    
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=2,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _cache_path(self, date: datetime, lat, lon) -> Path:
+        """Build cache file path for a (date, location, method) key"""
+        key = f"{date.strftime('%Y-%m-%d')}|{round(lat, 3)}|{round(lon, 3)}|{self.config.get('calculation_method', 4)}"
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+        return self.CACHE_DIR / f"timings-{digest}.json"
+
+    @staticmethod
+    def _validate_timings(data: Dict) -> bool:
+        """Check a cached payload has a well-formed time for every prayer"""
+        timings = data.get('timings')
+        if not isinstance(timings, dict):
+            return False
+        return all(
+            isinstance(timings.get(prayer), str) and re.match(r'^\d{2}:\d{2}', timings[prayer])
+            for prayer in PRAYERS
+        )
+
+    def _read_cache(self, date: datetime, lat, lon) -> Optional[Dict]:
+        """Load cached prayer times for the given day, if present"""
+        try:
+            with open(self._cache_path(date, lat, lon), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('date') == date.strftime('%Y-%m-%d') and self._validate_timings(cached['data']):
+                return cached['data']
+        except Exception:
+            pass
+        return None
+
+    def _write_cache(self, date: datetime, lat, lon, data: Dict):
+        """Store a fetched API response on disk for reuse"""
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path = self._cache_path(date, lat, lon)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'date': date.strftime('%Y-%m-%d'), 'data': data}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            pass
+
+    LOCATION_CACHE_TTL = 1800  # seconds
+
+    def _location_cache_path(self) -> Path:
+        return self.CACHE_DIR / "location.json"
+
     def get_location(self) -> Optional[Dict]:
         """Get location from IP"""
+        try:
+            with open(self._location_cache_path(), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if time.time() - cached.get('ts', 0) < self.LOCATION_CACHE_TTL:
+                return cached['data']
+        except Exception:
+            pass
+
         try:
             response = self.session.get(self.LOCATION_API, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('status') == 'success':
-                    return {
+                    location = {
                         'city': data.get('city', 'Unknown'),
                         'country': data.get('country', 'Unknown'),
                         'lat': data.get('lat'),
                         'lon': data.get('lon'),
                         'timezone': data.get('timezone')
                     }
+                    self._write_location_cache(location)
+                    return location
         except Exception:
             pass
         return None
+
+    def _write_location_cache(self, location: Dict):
+        """Store the detected location atomically for warm restarts"""
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path = self._location_cache_path()
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'ts': time.time(), 'data': location}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            pass
     
+    def compute_local(self, date: datetime, lat, lon) -> Optional[Dict]:
+        """Compute timings locally with the optional 'adhan' package"""
+        if LocalPrayerTimes is None:
+            return None
+
+        method_name = self.LOCAL_METHODS.get(self.config.get('calculation_method', 4))
+        if method_name is None or not hasattr(CalculationMethod, method_name):
+            return None
+
+        try:
+            tz_name = self.config.get('timezone')
+            tz = ZoneInfo(tz_name) if tz_name else None
+
+            times = LocalPrayerTimes(
+                Coordinates(lat, lon),
+                date.date(),
+                getattr(CalculationMethod, method_name)
+            )
+
+            timings = {}
+            for prayer in PRAYERS:
+                prayer_time = getattr(times, prayer.lower())
+                # The library yields UTC datetimes; without a configured
+                # zone fall back to system local time rather than printing
+                # UTC wall time
+                prayer_time = prayer_time.astimezone(tz) if tz else prayer_time.astimezone()
+                timings[prayer] = prayer_time.strftime('%H:%M')
+
+            return {'timings': timings}
+        except Exception:
+            return None
+
+    def _month_cache_path(self, date: datetime) -> Path:
+        return self.CACHE_DIR / f"month-{date.strftime('%Y-%m')}.json"
+
+    def _evict_old_months(self):
+        """Delete month tables that have not been touched in 60 days"""
+        cutoff = time.time() - 60 * 86400
+        try:
+            for path in self.CACHE_DIR.glob('month-*.json'):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+        except Exception:
+            pass
+
+    def ensure_month_cache(self, date: datetime) -> Optional[Dict]:
+        """Load or precompute the full month's timings (local path only)"""
+        if LocalPrayerTimes is None:
+            return None
+
+        lat = self.config.get('latitude')
+        lon = self.config.get('longitude')
+        method = self.config.get('calculation_method', 4)
+        if not lat or not lon:
+            return None
+
+        path = self._month_cache_path(date)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                table = json.load(f)
+            if table.get('lat') == lat and table.get('lon') == lon and table.get('method') == method:
+                return table['days']
+        except Exception:
+            pass
+
+        days = {}
+        day = date.replace(day=1)
+        while day.month == date.month:
+            computed = self.compute_local(day, lat, lon)
+            if computed is None:
+                return None
+            days[day.strftime('%Y-%m-%d')] = computed['timings']
+            day += timedelta(days=1)
+
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'lat': lat, 'lon': lon, 'method': method, 'days': days}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            self._evict_old_months()
+        except Exception:
+            pass
+
+        return days
+
     def fetch_prayer_times(self, date: Optional[datetime] = None) -> Optional[Dict]:
         """Fetch prayer times from API"""
         if date is None:
             date = datetime.now()
-        
+
+        lat = self.config.get('latitude')
+        lon = self.config.get('longitude')
+
+        if lat and lon:
+            cached = self._read_cache(date, lat, lon)
+            if cached is not None:
+                return cached
+
         if self.config.get('auto_detect_location'):
             location = self.get_location()
             if location:
@@ -138,10 +346,26 @@ class PrayerTimesAPI:
         
         lat = self.config.get('latitude')
         lon = self.config.get('longitude')
-        
+
         if not lat or not lon:
             return None
-        
+
+        cached = self._read_cache(date, lat, lon)
+        if cached is not None:
+            return cached
+
+        if not self.config.get('auto_detect_location'):
+            month = self.ensure_month_cache(date)
+            if month:
+                timings = month.get(date.strftime('%Y-%m-%d'))
+                if timings:
+                    return {'timings': timings}
+
+            local = self.compute_local(date, lat, lon)
+            if local is not None:
+                self._write_cache(date, lat, lon, local)
+                return local
+
         try:
             url = f"{self.BASE_URL}/timings/{date.strftime('%d-%m-%Y')}"
             params = {
@@ -154,6 +378,7 @@ class PrayerTimesAPI:
             if response.status_code == 200:
                 data = response.json()
                 if data.get('code') == 200:
+                    self._write_cache(date, lat, lon, data['data'])
                     return data['data']
         except Exception:
             pass
@@ -191,7 +416,14 @@ class PrayerTimesManager:
         self.hijri_date = ""
         self.location_data = None
         self.timezone = None
-    
+        self._schedule: List[Tuple[datetime, str]] = []
+        self._next_idx = 0
+        self._next_cache = None
+
+    def now(self) -> datetime:
+        """Current time in the configured timezone (naive local fallback)"""
+        return datetime.now(self.timezone) if self.timezone else datetime.now()
+
     def update(self) -> bool:
         """Update prayer times from API"""
         data = self.api.fetch_prayer_times()
@@ -206,45 +438,61 @@ class PrayerTimesManager:
                 self.timezone = None
         
         timings = data.get('timings', {})
-        date_obj = datetime.now(self.timezone) if self.timezone else datetime.now()
+        date_obj = self.now()
         
         self.prayer_times = {}
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
+        for prayer in PRAYERS:
             if prayer in timings:
                 time_str = timings[prayer].split()[0]
                 try:
-                    hour, minute = map(int, time_str.split(':'))
+                    hour, minute = _parse_hhmm(time_str)
                     prayer_time = date_obj.replace(hour=hour, minute=minute, second=0, microsecond=0)
                     self.prayer_times[prayer] = prayer_time
                 except Exception:
                     pass
         
+        self._schedule = sorted((t, name) for name, t in self.prayer_times.items())
+        self._next_idx = 0
+        self._next_cache = None
+        while self._next_idx < len(self._schedule) and self._schedule[self._next_idx][0] <= date_obj:
+            self._next_idx += 1
+
         hijri = data.get('date', {}).get('hijri', {})
-        self.hijri_date = f"{hijri.get('day', '')} {hijri.get('month', {}).get('en', '')} {hijri.get('year', '')}"
+        self.hijri_date = f"{hijri.get('day', '')} {hijri.get('month', {}).get('en', '')} {hijri.get('year', '')}".strip()
         
         self.location_data = self.api.get_location()
         
         return True
     
     def get_next_prayer(self) -> Optional[Tuple[str, datetime]]:
-        """Get next prayer name and time"""
-        now = datetime.now(self.timezone) if self.timezone else datetime.now()
-        
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
+        """Get next prayer name and time (memoized per minute)"""
+        now = self.now()
+        minute_key = (now.year, now.month, now.day, now.hour, now.minute)
+
+        if self._next_cache and self._next_cache[0] == minute_key:
+            return self._next_cache[1]
+
+        result = self._compute_next_prayer(now)
+        self._next_cache = (minute_key, result)
+        return result
+
+    def _compute_next_prayer(self, now: datetime) -> Optional[Tuple[str, datetime]]:
+        """Find the first prayer still ahead of `now`"""
+        for prayer in PRAYERS:
             if prayer in self.prayer_times:
                 prayer_time = self.prayer_times[prayer]
                 if prayer_time > now:
                     return (prayer, prayer_time)
-        
+
         if 'Fajr' in self.prayer_times:
             fajr_tomorrow = self.prayer_times['Fajr'] + timedelta(days=1)
             return ('Fajr', fajr_tomorrow)
-        
+
         return None
     
     def get_time_remaining(self, target_time: datetime) -> Tuple[int, int, int]:
         """Calculate time remaining until target"""
-        now = datetime.now(self.timezone) if self.timezone else datetime.now()
+        now = self.now()
         diff = target_time - now
         
         if diff.total_seconds() < 0:
@@ -256,15 +504,14 @@ class PrayerTimesManager:
         
         return (hours, minutes, seconds)
     
-    def is_prayer_time(self, prayer: str) -> bool:
-        """Check if it's time for a specific prayer"""
-        if prayer not in self.prayer_times:
-            return False
-        
-        now = datetime.now(self.timezone) if self.timezone else datetime.now()
-        prayer_time = self.prayer_times[prayer]
-        
-        return abs((now - prayer_time).total_seconds()) < 60
+    def due_prayers(self) -> List[str]:
+        """Advance the schedule index and return prayers that just became due"""
+        now = self.now()
+        due = []
+        while self._next_idx < len(self._schedule) and now >= self._schedule[self._next_idx][0]:
+            due.append(self._schedule[self._next_idx][1])
+            self._next_idx += 1
+        return due
 
 
 # ============================================================================
@@ -272,58 +519,59 @@ class PrayerTimesManager:
 # ============================================================================
 
 class AudioPlayer:
-    """Handles audio playback in separate thread"""
-    
+    """Handles audio playback without blocking the main loop"""
+
+    PLAYERS = (
+        ('mpv', ['--no-video', '--really-quiet']),
+        ('ffplay', ['-nodisp', '-autoexit', '-loglevel', 'quiet']),
+        ('mpg123', ['-q'])
+    )
+
     def __init__(self, config: ConfigManager):
         self.config = config
-        self.is_playing = False
-        self.thread = None
+        self._player_proc = None
+        self._player_cmd = self._resolve_player()
+
+    def _resolve_player(self) -> Optional[List[str]]:
+        """Find the first available audio player once, at startup"""
+        for name, args in self.PLAYERS:
+            path = shutil.which(name)
+            if path:
+                return [path] + args
+        return None
     
     def play(self, audio_file: str):
-        """Play audio file in separate thread"""
+        """Play audio file without waiting for it to finish"""
         if self.config.get('mute', False):
             return
-        
-        if self.is_playing:
-            return
-        
-        self.thread = threading.Thread(target=self._play_audio, args=(audio_file,), daemon=True)
-        self.thread.start()
-    
-    def _play_audio(self, audio_file: str):
-        """Internal method to play audio"""
-        if not Path(audio_file).exists():
+
+        if not self._player_cmd or not audio_file:
             return
-        
-        self.is_playing = True
-        
+
+        if self._player_proc and self._player_proc.poll() is None:
+            self._player_proc.terminate()
+
         try:
-            players = [
-                (['mpv', '--no-video', '--really-quiet', audio_file], True),
-                (['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet', audio_file], True),
-                (['mpg123', '-q', audio_file], True)
-            ]
-            
-            for cmd, _ in players:
-                try:
-                    if subprocess.run(['which', cmd[0]], capture_output=True).returncode == 0:
-                        subprocess.run(cmd, check=False, capture_output=True)
-                        break
-                except Exception:
-                    continue
-        finally:
-            self.is_playing = False
+            self._player_proc = subprocess.Popen(
+                self._player_cmd + [audio_file],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except Exception:
+            self._player_proc = None
     
     def send_notification(self, title: str, message: str):
-        """Send desktop notification"""
+        """Send desktop notification without waiting for it"""
         try:
-            subprocess.run([
+            subprocess.Popen([
                 'notify-send',
                 '-u', 'critical',
                 '-i', 'appointment-soon',
                 title,
                 message
-            ], check=False, capture_output=True)
+            ], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception:
             pass
 
@@ -334,17 +582,22 @@ class AudioPlayer:
 
 class UIRenderer:
     """Renders the TUI using Rich library"""
-    
+
+    HEADER_TITLE = Text("🕌 ADHAN LIVE - PRAYER TIMES", style="bold cyan", justify="center")
+    NEXT_TITLE_TMPL = "{icon}  [bold {color}]NEXT PRAYER: {name}[/]  {icon}"
+    NEXT_TIME_TMPL = "⏰ Time: [bold white]{time}[/]"
+    NEXT_COUNTDOWN_TMPL = "⏳ Countdown: [bold green]{h:02d}[/]h [bold green]{m:02d}[/]m [bold green]{s:02d}[/]s"
+
     def __init__(self, prayer_manager: PrayerTimesManager):
         self.prayer_manager = prayer_manager
         self.console = Console()
+        self._layout = None
+        self._table_cache = None
     
     def create_header(self) -> Panel:
         """Create header panel"""
         pm = self.prayer_manager
         
-        title = Text("🕌 ADHAN LIVE - PRAYER TIMES", style="bold cyan", justify="center")
-        
         info_lines = []
         
         if pm.location_data:
@@ -356,7 +609,7 @@ class UIRenderer:
             info_lines.append(f"📍 Location: {city}, {country}")
             info_lines.append(f"🌐 Coordinates: {lat:.4f}, {lon:.4f}")
         
-        now = datetime.now()
+        now = pm.now()
         info_lines.append(f"📅 Date: {now.strftime('%A, %B %d, %Y')}")
         
         if pm.hijri_date:
@@ -366,12 +619,25 @@ class UIRenderer:
         
         content = "\n".join(info_lines)
         
-        return Panel(content, title=title, border_style="cyan", box=box.DOUBLE)
+        return Panel(content, title=self.HEADER_TITLE, border_style="cyan", box=box.DOUBLE)
     
     def create_prayer_table(self) -> Table:
-        """Create prayer times table"""
+        """Create prayer times table (memoized per minute)"""
         pm = self.prayer_manager
-        
+        now = pm.now()
+        key = (now.year, now.month, now.day, now.hour, now.minute)
+
+        if self._table_cache and self._table_cache[0] == key:
+            return self._table_cache[1]
+
+        table = self._build_prayer_table(now)
+        self._table_cache = (key, table)
+        return table
+
+    def _build_prayer_table(self, now: datetime) -> Table:
+        """Render the prayer times table for the given instant"""
+        pm = self.prayer_manager
+
         table = Table(
             title="✨ PRAYER TIMES FOR TODAY ✨",
             title_style="bold white",
@@ -387,9 +653,7 @@ class UIRenderer:
         table.add_column("Time", style="bold", width=10)
         table.add_column("Status", style="dim", width=15)
         
-        now = datetime.now(pm.timezone) if pm.timezone else datetime.now()
-        
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
+        for prayer in PRAYERS:
             if prayer not in pm.prayer_times:
                 continue
             
@@ -435,17 +699,17 @@ class UIRenderer:
         icon = pm.PRAYER_ICONS.get(prayer, '🕌')
         
         lines = []
-        lines.append(f"{icon}  [bold {color}]NEXT PRAYER: {prayer.upper()}[/]  {icon}")
+        lines.append(self.NEXT_TITLE_TMPL.format(icon=icon, color=color, name=prayer.upper()))
         lines.append("")
-        lines.append(f"⏰ Time: [bold white]{prayer_time.strftime('%H:%M')}[/]")
+        lines.append(self.NEXT_TIME_TMPL.format(time=prayer_time.strftime('%H:%M')))
         lines.append("")
-        lines.append(f"⏳ Countdown: [bold green]{hours:02d}[/]h [bold green]{minutes:02d}[/]m [bold green]{seconds:02d}[/]s")
+        lines.append(self.NEXT_COUNTDOWN_TMPL.format(h=hours, m=minutes, s=seconds))
         
-        now = datetime.now(pm.timezone) if pm.timezone else datetime.now()
+        now = pm.now()
         total_seconds = (prayer_time - now).total_seconds()
         
         prev_prayer_time = now.replace(hour=0, minute=0, second=0)
-        for p in ['Isha', 'Maghrib', 'Asr', 'Dhuhr', 'Fajr']:
+        for p in reversed(PRAYERS):
             if p in pm.prayer_times and pm.prayer_times[p] < now:
                 prev_prayer_time = pm.prayer_times[p]
                 break
@@ -475,31 +739,30 @@ class UIRenderer:
     
     def render_live_view(self) -> Layout:
         """Create complete live view layout"""
-        layout = Layout()
-        
-        layout.split_column(
-            Layout(name="header", size=9),
-            Layout(name="table", size=12),
-            Layout(name="next", size=10),
-            Layout(name="footer", size=1)
-        )
-        
+        if self._layout is None:
+            self._layout = Layout()
+            self._layout.split_column(
+                Layout(name="header", size=9),
+                Layout(name="table", size=12),
+                Layout(name="next", size=10),
+                Layout(name="footer", size=1)
+            )
+            self._layout["footer"].update(self.create_footer())
+
+        layout = self._layout
+
         layout["header"].update(self.create_header())
         layout["table"].update(self.create_prayer_table())
-        
+
         next_panel = self.create_next_prayer_panel()
         if next_panel:
             layout["next"].update(next_panel)
-        
-        layout["footer"].update(self.create_footer())
-        
+
         return layout
     
     def print_today(self):
         """Print today's prayer times (static)"""
-        self.console.print(self.create_header())
-        self.console.print()
-        self.console.print(self.create_prayer_table())
+        self.console.print(Group(self.create_header(), "", self.create_prayer_table()))
     
     def print_next(self):
         """Print next prayer only (static)"""
@@ -531,6 +794,7 @@ class AdhanLiveApp:
         
         self.last_played_prayer = None
         self.last_update_date = None
+        self.prefetched_date = None
     
     def initialize(self) -> bool:
         """Initialize application and fetch prayer times"""
@@ -547,40 +811,75 @@ class AdhanLiveApp:
     
     def check_prayer_time(self):
         """Check if it's prayer time and play adhan"""
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
-            if self.prayer_manager.is_prayer_time(prayer) and prayer != self.last_played_prayer:
-                audio_file = self.config.get('audio_file')
-                self.audio_player.play(audio_file)
-                
-                title = "🕌 Adhan Live"
-                message = f"It's time for {prayer} prayer!"
-                self.audio_player.send_notification(title, message)
-                
-                self.last_played_prayer = prayer
-                break
+        for prayer in self.prayer_manager.due_prayers():
+            audio_file = self.config.get('audio_file')
+            self.audio_player.play(audio_file)
+
+            title = "🕌 Adhan Live"
+            message = f"It's time for {prayer} prayer!"
+            self.audio_player.send_notification(title, message)
+
+            self.last_played_prayer = prayer
     
+    def _tick_interval(self) -> float:
+        """Pick a refresh interval based on time until the next prayer"""
+        next_prayer_data = self.prayer_manager.get_next_prayer()
+        if not next_prayer_data:
+            return 1
+
+        hours, minutes, seconds = self.prayer_manager.get_time_remaining(next_prayer_data[1])
+        remaining = hours * 3600 + minutes * 60 + seconds
+
+        if remaining < 5:
+            return 0.2
+        if remaining < 90:
+            return 1
+        if remaining < 600:
+            return 10
+        return 60
+
     def update_if_needed(self):
         """Update prayer times if date changed"""
-        current_date = datetime.now().date()
+        now = self.prayer_manager.now()
+        current_date = now.date()
         if self.last_update_date != current_date:
             self.prayer_manager.update()
             self.last_update_date = current_date
             self.last_played_prayer = None
+
+        if now.hour == 23:
+            tomorrow = now + timedelta(days=1)
+            if self.prefetched_date != tomorrow.date():
+                self.prefetched_date = tomorrow.date()
+                threading.Thread(
+                    target=self.prayer_manager.api.fetch_prayer_times,
+                    args=(tomorrow,),
+                    daemon=True
+                ).start()
     
     def run_live(self):
         """Run live view with auto-refresh"""
         if not self.initialize():
             return
         
-        self.last_update_date = datetime.now().date()
+        self.last_update_date = self.prayer_manager.now().date()
         
         try:
             with Live(self.ui.render_live_view(), refresh_per_second=1, console=self.console) as live:
+                deadline = time.monotonic()
                 while True:
                     self.update_if_needed()
                     self.check_prayer_time()
                     live.update(self.ui.render_live_view())
-                    time.sleep(1)
+
+                    deadline += self._tick_interval()
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        time.sleep(remaining)
+                    else:
+                        # Overslept (e.g. suspend/resume): realign instead of
+                        # burning CPU trying to catch up tick by tick.
+                        deadline = time.monotonic()
         except KeyboardInterrupt:
             self.console.print()
             self.console.print(Panel(
@@ -8,13 +8,19 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, GLib, Gdk, Pango
 import os
+import re
 import sys
 import json
 import time
+import bisect
+import shutil
 import subprocess
+import functools
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Dict, Optional, Tuple
 
 try:
@@ -24,10 +30,133 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: 'requests' module not found. Install it with: pip install requests")
     sys.exit(1)
 
+# Matches the leading "HH:MM" of an Aladhan timing string such as "05:35 (EET)"
+_HHMM_RE = re.compile(r'^(\d{1,2}):(\d{2})')
+
+# Chronological prayer order, shared so hot paths don't rebuild the list
+_PRAYER_ORDER = ('Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha')
+_PRAYER_ORDER_REV = _PRAYER_ORDER[::-1]
+
+# One fixed %-template for the per-tick countdown write; parsed once at import
+_COUNTDOWN_FMT = '◵ %02d:%02d:%02d'
+
+# Single worker for background prayer-time fetches; one refresh at a time
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Config value <-> combo index tables for the appearance settings
+_THEME_NAMES = ('auto', 'light', 'dark')
+_THEME_INDEX = {name: i for i, name in enumerate(_THEME_NAMES)}
+_LANG_NAMES = ('en', 'ar')
+
+
+# Application stylesheet, kept at module scope so the CssProvider parses
+# it a single time per process
+_ADHAN_CSS = b"""
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            border-radius: 10px;
+            margin-bottom: 10px;
+        }
+        
+        .prayer-box {
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 8px;
+            margin: 5px;
+            border-left: 4px solid #667eea;
+        }
+        
+        .prayer-box-completed {
+            background: #e9ecef;
+            opacity: 0.7;
+        }
+        
+        .next-prayer {
+            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+            color: white;
+            padding: 20px;
+            border-radius: 10px;
+            margin: 10px 0;
+        }
+        
+        .prayer-name {
+            font-size: 18px;
+            font-weight: bold;
+        }
+        
+        .prayer-time {
+            font-size: 24px;
+            font-weight: bold;
+        }
+        
+        .countdown {
+            font-size: 32px;
+            font-weight: bold;
+        }
+        """
+
+
+def _label_attrs(scale: float, bold: bool = False) -> Pango.AttrList:
+    """Fixed label styling installed once, so per-tick updates can call
+    set_text instead of having Pango re-parse span markup every second"""
+    attrs = Pango.AttrList()
+    attrs.insert(Pango.attr_scale_new(scale))
+    if bold:
+        attrs.insert(Pango.attr_weight_new(Pango.Weight.BOLD))
+    return attrs
+
+
+@functools.lru_cache(maxsize=16)
+def _get_tz(name: str) -> Optional[ZoneInfo]:
+    """Timezone lookup cache; ZoneInfo parses tzdata files on construction"""
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+# Static Pango markup for the settings dialog, assembled once at import so
+# opening the dialog doesn't rebuild and re-interpolate these strings
+_ABOUT_TITLE_MARKUP = '<span size="xx-large" weight="bold">◈ Adhan Live ◈</span>'
+_ABOUT_VERSION_MARKUP = '<span size="large">Version 2.0.0</span>'
+_ABOUT_DESC_MARKUP = (
+    '<span size="medium">'
+    'Professional Islamic prayer times display\n'
+    'with beautiful TUI and GUI interfaces'
+    '</span>'
+)
+_ABOUT_FEATURES_MARKUP = (
+    '<b>Features:</b>\n'
+    '• Auto-detect location via IP\n'
+    '• Real-time countdown with progress bar\n'
+    '• Desktop notifications\n'
+    '• Hijri and Gregorian dates\n'
+    '• Multi-language support\n'
+    '• Threaded audio playback'
+)
+_ABOUT_GITHUB_MARKUP = (
+    '<a href="https://github.com/enzoxwashere/Adhan-Live">◈ GitHub Repository</a>'
+)
+_ABOUT_COPYRIGHT_MARKUP = (
+    '<span size="small">© 2025 Enzo\n'
+    'Licensed under MIT License</span>'
+)
+_LOCATION_INFO_TEMPLATE = (
+    "<b>City:</b> {city}\n"
+    "<b>Country:</b> {country}\n"
+    "<b>Latitude:</b> {lat:.4f}\n"
+    "<b>Longitude:</b> {lon:.4f}\n"
+    "<b>Timezone:</b> {tz}"
+)
+
 
 # ============================================================================
 # Configuration Manager
@@ -83,6 +212,15 @@ class ConfigManager:
         self.config[key] = value
         self.save()
 
+    def set_many(self, updates: Dict):
+        """Set several configuration values with a single save"""
+        self.config.update(updates)
+        self.save()
+
+    def snapshot(self) -> Dict:
+        """Plain-dict copy for callers that read many keys in one pass"""
+        return dict(self.config)
+
 
 # ============================================================================
 # Prayer Times API Client
@@ -91,40 +229,48 @@ class ConfigManager:
 class PrayerTimesAPI:
     """Handles API calls to Aladhan API"""
     
-    BASE_URL = "http://api.aladhan.com/v1"
+    BASE_URL = "https://api.aladhan.com/v1"
     LOCATION_API = "http://ip-api.com/json/"
-    
+
     def __init__(self, config: ConfigManager):
         self.config = config
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': 'AdhanLive/2.0'})
-    
+        # Retries with backoff are handled at the transport layer so the
+        # request methods below no longer need hand-rolled retry loops
+        retry = Retry(
+            total=self.config.get('retry_attempts', 3),
+            backoff_factor=self.config.get('retry_delay', 2) * 0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET'])
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def get_location(self) -> Optional[Dict]:
-        retry_attempts = self.config.get('retry_attempts', 3)
-        retry_delay = self.config.get('retry_delay', 2)
-        
-        for attempt in range(retry_attempts):
-            try:
-                response = self.session.get(self.LOCATION_API, timeout=5)
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get('status') == 'success':
-                    location = {
-                        'city': data.get('city', 'Unknown'),
-                        'country': data.get('country', 'Unknown'),
-                        'lat': data.get('lat'),
-                        'lon': data.get('lon'),
-                        'timezone': data.get('timezone')
-                    }
-                    self.config.set('city', location['city'])
-                    self.config.set('country', location['country'])
-                    return location
-                    
-            except Exception:
-                if attempt < retry_attempts - 1:
-                    time.sleep(retry_delay)
-        
+        try:
+            response = self.session.get(self.LOCATION_API, timeout=5)
+            response.raise_for_status()
+            data = response.json()
+
+            if data.get('status') == 'success':
+                location = {
+                    'city': data.get('city', 'Unknown'),
+                    'country': data.get('country', 'Unknown'),
+                    'lat': data.get('lat'),
+                    'lon': data.get('lon'),
+                    'timezone': data.get('timezone')
+                }
+                self.config.set_many({
+                    'city': location['city'],
+                    'country': location['country']
+                })
+                return location
+
+        except Exception:
+            pass
+
         return None
     
     def fetch_prayer_times(self, date: Optional[datetime] = None) -> Optional[Dict]:
@@ -134,39 +280,36 @@ class PrayerTimesAPI:
         if self.config.get('auto_detect_location'):
             location = self.get_location()
             if location:
-                self.config.set('latitude', location['lat'])
-                self.config.set('longitude', location['lon'])
-                self.config.set('timezone', location['timezone'])
+                self.config.set_many({
+                    'latitude': location['lat'],
+                    'longitude': location['lon'],
+                    'timezone': location['timezone']
+                })
         
         lat = self.config.get('latitude')
         lon = self.config.get('longitude')
         
         if not lat or not lon:
             return None
-        
-        retry_attempts = self.config.get('retry_attempts', 3)
-        retry_delay = self.config.get('retry_delay', 2)
-        
-        for attempt in range(retry_attempts):
-            try:
-                url = f"{self.BASE_URL}/timings/{date.strftime('%d-%m-%Y')}"
-                params = {
-                    'latitude': lat,
-                    'longitude': lon,
-                    'method': self.config.get('calculation_method', 4)
-                }
-                
-                response = self.session.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get('code') == 200:
-                    return data['data']
-                    
-            except Exception:
-                if attempt < retry_attempts - 1:
-                    time.sleep(retry_delay)
-        
+
+        try:
+            url = f"{self.BASE_URL}/timings/{date.strftime('%d-%m-%Y')}"
+            params = {
+                'latitude': lat,
+                'longitude': lon,
+                'method': self.config.get('calculation_method', 4)
+            }
+
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+
+            if data.get('code') == 200:
+                return data['data']
+
+        except Exception:
+            pass
+
         return None
 
 
@@ -177,21 +320,21 @@ class PrayerTimesAPI:
 class PrayerTimesManager:
     """Manages prayer times and calculations"""
     
-    PRAYER_COLORS = {
+    PRAYER_COLORS = MappingProxyType({
         'Fajr': '#E91E63',
         'Dhuhr': '#FFC107',
         'Asr': '#00BCD4',
         'Maghrib': '#F44336',
         'Isha': '#3F51B5'
-    }
-    
-    PRAYER_ICONS = {
+    })
+
+    PRAYER_ICONS = MappingProxyType({
         'Fajr': '◗',
         'Dhuhr': '◉',
         'Asr': '◐',
         'Maghrib': '◖',
         'Isha': '◕'
-    }
+    })
     
     def __init__(self, config: ConfigManager):
         self.config = config
@@ -200,76 +343,88 @@ class PrayerTimesManager:
         self.hijri_date = ""
         self.location_data = None
         self.timezone = None
-    
+        self._ts_memo = {}
+        self._trigger_ts = {}
+        self._now_cache = (0.0, None)
+        self._ordered_times = []
+        self._ordered_ts = []
+
+    def _now(self) -> datetime:
+        """Current time in the configured timezone, memoized for 250 ms
+
+        One GUI tick consults "now" several times (next prayer, countdown,
+        per-prayer status); they should all see the same instant without
+        re-allocating tz-aware datetimes per call.
+        """
+        t = time.monotonic()
+        if self._now_cache[1] is not None and t - self._now_cache[0] < 0.25:
+            return self._now_cache[1]
+        n = datetime.now(self.timezone) if self.timezone else datetime.now()
+        self._now_cache = (t, n)
+        return n
+
     def update(self) -> bool:
         data = self.api.fetch_prayer_times()
         if not data:
             return False
-        
+
         tz_name = self.config.get('timezone')
         if tz_name:
-            try:
-                self.timezone = ZoneInfo(tz_name)
-            except Exception:
-                self.timezone = None
-        
+            self.timezone = _get_tz(tz_name)
+
         timings = data.get('timings', {})
-        date_obj = datetime.now(self.timezone) if self.timezone else datetime.now()
+        self._now_cache = (0.0, None)
+        date_obj = self._now()
         
         self.prayer_times = {}
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
+        y, mo, d = date_obj.year, date_obj.month, date_obj.day
+        tz = self.timezone
+        for prayer in _PRAYER_ORDER:
             if prayer in timings:
-                time_str = timings[prayer].split()[0]
-                try:
-                    hour, minute = map(int, time_str.split(':'))
-                    prayer_time = date_obj.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    self.prayer_times[prayer] = prayer_time
-                except Exception:
-                    pass
-        
+                m = _HHMM_RE.match(timings[prayer])
+                if m:
+                    hour, minute = int(m.group(1)), int(m.group(2))
+                    self.prayer_times[prayer] = datetime(y, mo, d, hour, minute, 0, 0, tz)
+        
+        # Keep a time-sorted view so next-prayer lookups bisect instead of
+        # probing the dict prayer by prayer on every countdown tick
+        self._ordered_times = sorted(self.prayer_times.items(), key=lambda kv: kv[1])
+        self._ordered_ts = [int(dt.timestamp()) for _, dt in self._ordered_times]
+        self._ts_memo = {dt: ts for (_, dt), ts in zip(self._ordered_times, self._ordered_ts)}
+        self._trigger_ts = {name: ts for (name, _), ts in zip(self._ordered_times, self._ordered_ts)}
+
         hijri = data.get('date', {}).get('hijri', {})
         self.hijri_date = f"{hijri.get('day', '')} {hijri.get('month', {}).get('en', '')} {hijri.get('year', '')}"
-        
+
         self.location_data = self.api.get_location()
-        
+
         return True
-    
+
     def get_next_prayer(self) -> Optional[Tuple[str, datetime]]:
-        now = datetime.now(self.timezone) if self.timezone else datetime.now()
-        
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
-            if prayer in self.prayer_times:
-                prayer_time = self.prayer_times[prayer]
-                if prayer_time > now:
-                    return (prayer, prayer_time)
-        
+        idx = bisect.bisect_right(self._ordered_ts, self._now().timestamp())
+        if idx < len(self._ordered_times):
+            return self._ordered_times[idx]
+
         if 'Fajr' in self.prayer_times:
             fajr_tomorrow = self.prayer_times['Fajr'] + timedelta(days=1)
             return ('Fajr', fajr_tomorrow)
-        
+
         return None
     
     def get_time_remaining(self, target_time: datetime) -> Tuple[int, int, int]:
-        now = datetime.now(self.timezone) if self.timezone else datetime.now()
-        diff = target_time - now
-        
-        if diff.total_seconds() < 0:
-            return (0, 0, 0)
-        
-        hours = diff.seconds // 3600
-        minutes = (diff.seconds % 3600) // 60
-        seconds = diff.seconds % 60
-        
-        return (hours, minutes, seconds)
-    
+        ts = self._ts_memo.get(target_time)
+        if ts is None:
+            ts = int(target_time.timestamp())
+        return self.get_time_remaining_ts(ts)
+
+    def get_time_remaining_ts(self, target_ts: int) -> Tuple[int, int, int]:
+        """Countdown on plain integer seconds, with no timedelta allocation"""
+        diff = max(0, target_ts - int(time.time()))
+        return (diff // 3600, (diff % 3600) // 60, diff % 60)
+
     def is_prayer_time(self, prayer: str) -> bool:
-        if prayer not in self.prayer_times:
-            return False
-        
-        now = datetime.now(self.timezone) if self.timezone else datetime.now()
-        prayer_time = self.prayer_times[prayer]
-        
-        return abs((now - prayer_time).total_seconds()) < 60
+        ts = self._trigger_ts.get(prayer)
+        return ts is not None and abs(int(time.time()) - ts) < 60
 
 
 # ============================================================================
@@ -279,54 +434,79 @@ class PrayerTimesManager:
 class AudioPlayer:
     """Handles audio playback"""
     
+    # Candidate players with {file}/{volume} placeholders, in preference order
+    PLAYERS = (
+        ('mpv', ['mpv', '--no-video', '--really-quiet', '--volume={volume}', '{file}']),
+        ('ffplay', ['ffplay', '-nodisp', '-autoexit', '-volume', '{ffplay_volume}', '{file}']),
+        ('mpg123', ['mpg123', '-q', '{file}'])
+    )
+
     def __init__(self, config: ConfigManager):
         self.config = config
-        self.is_playing = False
+        self._playing = threading.Event()
         self.thread = None
-    
+        self._player_cmd = None
+        self._resolve_player()
+        self._preload(config.get('audio_file', ''))
+
+    def _preload(self, audio_file: str):
+        """Warm the page cache so the first adhan doesn't wait on disk"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(audio_file, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+    def _resolve_player(self):
+        """Find an available player once so playback never probes with `which`"""
+        for name, template in self.PLAYERS:
+            path = shutil.which(name)
+            if path:
+                self._player_cmd = [path] + template[1:]
+                break
+
     def play(self, audio_file: str):
         if self.config.get('mute', False):
             return
         
-        if self.is_playing:
+        # Claim the playing flag before spawning the thread so two rapid
+        # triggers cannot both pass the check
+        if self._playing.is_set():
             return
-        
+        self._playing.set()
+
         self.thread = threading.Thread(target=self._play_audio, args=(audio_file,), daemon=True)
         self.thread.start()
-    
+
     def _play_audio(self, audio_file: str):
-        if not Path(audio_file).exists():
-            return
-        
-        self.is_playing = True
-        
         try:
+            if not Path(audio_file).exists() or self._player_cmd is None:
+                return
+
             volume = self.config.get('volume', 100)
-            players = [
-                (['mpv', '--no-video', '--really-quiet', f'--volume={volume}', audio_file], True),
-                (['ffplay', '-nodisp', '-autoexit', '-volume', str(volume * 10), audio_file], True),
-                (['mpg123', '-q', audio_file], True)
-            ]
-            
-            for cmd, _ in players:
-                try:
-                    if subprocess.run(['which', cmd[0]], capture_output=True).returncode == 0:
-                        subprocess.run(cmd, check=False, capture_output=True)
-                        break
-                except Exception:
-                    continue
+            cmd = [arg.format(file=audio_file, volume=volume,
+                              ffplay_volume=volume * 10)
+                   for arg in self._player_cmd]
+            subprocess.run(cmd, check=False, capture_output=True)
+        except Exception:
+            pass
         finally:
-            self.is_playing = False
+            self._playing.clear()
     
     def send_notification(self, title: str, message: str):
         try:
-            subprocess.run([
+            subprocess.Popen([
                 'notify-send',
                 '-u', 'critical',
                 '-i', 'appointment-soon',
                 title,
                 message
-            ], check=False, capture_output=True)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception:
             pass
 
@@ -337,7 +517,49 @@ class AudioPlayer:
 
 class SettingsDialog(Gtk.Dialog):
     """Settings dialog window"""
-    
+
+    CALCULATION_METHODS = (
+        "University of Islamic Sciences, Karachi",
+        "Islamic Society of North America",
+        "Muslim World League",
+        "Umm Al-Qura University, Makkah",
+        "Egyptian General Authority of Survey",
+        "Institute of Geophysics, University of Tehran",
+        "Gulf Region",
+        "Kuwait",
+        "Qatar",
+        "Majlis Ugama Islam Singapura, Singapore",
+        "Union Organization islamic de France",
+        "Diyanet İşleri Başkanlığı, Turkey",
+        "Spiritual Administration of Muslims of Russia"
+    )
+    THEMES = ("Auto (System)", "Light", "Dark")
+    LANGUAGES = ("English", "العربية (Arabic)")
+
+    # Shared combo models, built lazily and reused across dialog opens
+    _METHOD_STORE = None
+    _THEME_STORE = None
+    _LANG_STORE = None
+
+    @classmethod
+    def _list_store(cls, attr: str, items) -> Gtk.ListStore:
+        store = getattr(cls, attr)
+        if store is None:
+            store = Gtk.ListStore(str)
+            for item in items:
+                store.append([item])
+            setattr(cls, attr, store)
+        return store
+
+    @classmethod
+    def _model_combo(cls, attr: str, items) -> Gtk.ComboBox:
+        """Combo backed by a shared model: one install, no per-item signals"""
+        combo = Gtk.ComboBox.new_with_model(cls._list_store(attr, items))
+        renderer = Gtk.CellRendererText()
+        combo.pack_start(renderer, True)
+        combo.add_attribute(renderer, "text", 0)
+        return combo
+
     def __init__(self, parent, config: ConfigManager, prayer_manager: PrayerTimesManager):
         Gtk.Dialog.__init__(
             self,
@@ -347,8 +569,10 @@ class SettingsDialog(Gtk.Dialog):
         )
         
         self.config = config
+        self._cfg = config.snapshot()
         self.prayer_manager = prayer_manager
         self.location_changed = False
+        self._test_proc = None
         
         self.add_buttons(
             "◈ Cancel", Gtk.ResponseType.CANCEL,
@@ -362,17 +586,48 @@ class SettingsDialog(Gtk.Dialog):
         notebook = Gtk.Notebook()
         notebook.set_tab_pos(Gtk.PositionType.TOP)
         
-        # Add tabs
-        notebook.append_page(self.create_general_tab(), Gtk.Label(label="◈ General"))
-        notebook.append_page(self.create_location_tab(), Gtk.Label(label="◉ Location"))
-        notebook.append_page(self.create_audio_tab(), Gtk.Label(label="◵ Audio"))
-        notebook.append_page(self.create_appearance_tab(), Gtk.Label(label="◈ Appearance"))
-        notebook.append_page(self.create_about_tab(), Gtk.Label(label="◆ About"))
-        
+        # Add tabs. The first three are filled from an idle callback so the
+        # dialog frame paints before tab construction runs; Appearance and
+        # About are static-heavy and only built on first visit
+        self._deferred_pages = []
+        for builder, label in (
+            (self.create_general_tab, "◈ General"),
+            (self.create_location_tab, "◉ Location"),
+            (self.create_audio_tab, "◵ Audio")
+        ):
+            placeholder = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+            notebook.append_page(placeholder, Gtk.Label(label=label))
+            self._deferred_pages.append((placeholder, builder))
+        self._lazy_tabs = {}
+        for builder, label in (
+            (self.create_appearance_tab, "◈ Appearance"),
+            (self.create_about_tab, "◆ About")
+        ):
+            placeholder = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+            page_num = notebook.append_page(placeholder, Gtk.Label(label=label))
+            self._lazy_tabs[page_num] = builder
+        notebook.connect("switch-page", self.on_switch_page)
+
         box = self.get_content_area()
         box.add(notebook)
-        
+
         self.show_all()
+        GLib.idle_add(self._populate_deferred)
+
+    def _populate_deferred(self):
+        """Fill one pending page per idle pass, keeping input responsive"""
+        if self._deferred_pages:
+            page, builder = self._deferred_pages.pop(0)
+            page.pack_start(builder(), True, True, 0)
+            page.show_all()
+        return bool(self._deferred_pages)
+
+    def on_switch_page(self, notebook, page, page_num):
+        """Populate a deferred tab the first time the user opens it"""
+        builder = self._lazy_tabs.pop(page_num, None)
+        if builder is not None:
+            page.pack_start(builder(), True, True, 0)
+            page.show_all()
     
     def create_general_tab(self):
         """Create general settings tab"""
@@ -381,7 +636,7 @@ class SettingsDialog(Gtk.Dialog):
         
         # Auto detect location
         self.auto_detect_check = Gtk.CheckButton(label="◉ Auto-detect location via IP")
-        self.auto_detect_check.set_active(self.config.get('auto_detect_location', True))
+        self.auto_detect_check.set_active(self._cfg.get('auto_detect_location', True))
         box.pack_start(self.auto_detect_check, False, False, 0)
         
         # Calculation method
@@ -390,26 +645,9 @@ class SettingsDialog(Gtk.Dialog):
         method_label.set_halign(Gtk.Align.START)
         method_box.pack_start(method_label, False, False, 0)
         
-        self.method_combo = Gtk.ComboBoxText()
-        methods = [
-            "University of Islamic Sciences, Karachi",
-            "Islamic Society of North America",
-            "Muslim World League",
-            "Umm Al-Qura University, Makkah",
-            "Egyptian General Authority of Survey",
-            "Institute of Geophysics, University of Tehran",
-            "Gulf Region",
-            "Kuwait",
-            "Qatar",
-            "Majlis Ugama Islam Singapura, Singapore",
-            "Union Organization islamic de France",
-            "Diyanet İşleri Başkanlığı, Turkey",
-            "Spiritual Administration of Muslims of Russia"
-        ]
-        for method in methods:
-            self.method_combo.append_text(method)
-        
-        current_method = self.config.get('calculation_method', 4)
+        self.method_combo = self._model_combo('_METHOD_STORE', self.CALCULATION_METHODS)
+
+        current_method = self._cfg.get('calculation_method', 4)
         self.method_combo.set_active(current_method - 1)
         method_box.pack_start(self.method_combo, True, True, 0)
         box.pack_start(method_box, False, False, 0)
@@ -427,7 +665,7 @@ class SettingsDialog(Gtk.Dialog):
         
         self.retry_attempts_spin = Gtk.SpinButton()
         self.retry_attempts_spin.set_adjustment(Gtk.Adjustment(
-            value=self.config.get('retry_attempts', 3),
+            value=self._cfg.get('retry_attempts', 3),
             lower=1, upper=10, step_increment=1
         ))
         retry_attempts_box.pack_start(self.retry_attempts_spin, False, False, 0)
@@ -441,7 +679,7 @@ class SettingsDialog(Gtk.Dialog):
         
         self.retry_delay_spin = Gtk.SpinButton()
         self.retry_delay_spin.set_adjustment(Gtk.Adjustment(
-            value=self.config.get('retry_delay', 2),
+            value=self._cfg.get('retry_delay', 2),
             lower=1, upper=10, step_increment=1
         ))
         retry_delay_box.pack_start(self.retry_delay_spin, False, False, 0)
@@ -462,19 +700,15 @@ class SettingsDialog(Gtk.Dialog):
         info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
         info_box.set_border_width(10)
         
-        city = self.config.get('city', 'Unknown')
-        country = self.config.get('country', 'Unknown')
-        lat = self.config.get('latitude', 0)
-        lon = self.config.get('longitude', 0)
-        tz = self.config.get('timezone', 'Unknown')
+        city = self._cfg.get('city', 'Unknown')
+        country = self._cfg.get('country', 'Unknown')
+        lat = self._cfg.get('latitude', 0)
+        lon = self._cfg.get('longitude', 0)
+        tz = self._cfg.get('timezone', 'Unknown')
         
         info_label = Gtk.Label()
         info_label.set_markup(
-            f"<b>City:</b> {city}\n"
-            f"<b>Country:</b> {country}\n"
-            f"<b>Latitude:</b> {lat:.4f}\n"
-            f"<b>Longitude:</b> {lon:.4f}\n"
-            f"<b>Timezone:</b> {tz}"
+            _LOCATION_INFO_TEMPLATE.format(city=city, country=country, lat=lat, lon=lon, tz=tz)
         )
         info_label.set_halign(Gtk.Align.START)
         info_box.pack_start(info_label, False, False, 0)
@@ -549,7 +783,7 @@ class SettingsDialog(Gtk.Dialog):
         
         # Mute
         self.mute_check = Gtk.CheckButton(label="◵ Mute adhan sound")
-        self.mute_check.set_active(self.config.get('mute', False))
+        self.mute_check.set_active(self._cfg.get('mute', False))
         box.pack_start(self.mute_check, False, False, 0)
         
         # Volume
@@ -561,7 +795,7 @@ class SettingsDialog(Gtk.Dialog):
         self.volume_scale = Gtk.Scale.new_with_range(
             Gtk.Orientation.HORIZONTAL, 0, 100, 5
         )
-        self.volume_scale.set_value(self.config.get('volume', 100))
+        self.volume_scale.set_value(self._cfg.get('volume', 100))
         self.volume_scale.set_draw_value(True)
         self.volume_scale.set_value_pos(Gtk.PositionType.RIGHT)
         volume_box.pack_start(self.volume_scale, True, True, 0)
@@ -575,7 +809,7 @@ class SettingsDialog(Gtk.Dialog):
         file_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
         
         self.audio_entry = Gtk.Entry()
-        self.audio_entry.set_text(self.config.get('audio_file', '/usr/share/adhan-live/a1.mp3'))
+        self.audio_entry.set_text(self._cfg.get('audio_file', '/usr/share/adhan-live/a1.mp3'))
         file_box.pack_start(self.audio_entry, True, True, 0)
         
         browse_btn = Gtk.Button(label="◆ Browse")
@@ -605,13 +839,10 @@ class SettingsDialog(Gtk.Dialog):
         theme_label.set_halign(Gtk.Align.START)
         theme_box.pack_start(theme_label, False, False, 0)
         
-        self.theme_combo = Gtk.ComboBoxText()
-        self.theme_combo.append_text("Auto (System)")
-        self.theme_combo.append_text("Light")
-        self.theme_combo.append_text("Dark")
+        self.theme_combo = self._model_combo('_THEME_STORE', self.THEMES)
         
-        theme = self.config.get('theme', 'auto')
-        theme_index = {'auto': 0, 'light': 1, 'dark': 2}.get(theme, 0)
+        theme = self._cfg.get('theme', 'auto')
+        theme_index = _THEME_INDEX.get(theme, 0)
         self.theme_combo.set_active(theme_index)
         theme_box.pack_start(self.theme_combo, True, True, 0)
         box.pack_start(theme_box, False, False, 0)
@@ -622,12 +853,10 @@ class SettingsDialog(Gtk.Dialog):
         lang_label.set_halign(Gtk.Align.START)
         lang_box.pack_start(lang_label, False, False, 0)
         
-        self.lang_combo = Gtk.ComboBoxText()
-        self.lang_combo.append_text("English")
-        self.lang_combo.append_text("العربية (Arabic)")
+        self.lang_combo = self._model_combo('_LANG_STORE', self.LANGUAGES)
         
-        lang = self.config.get('language', 'en')
-        lang_index = 0 if lang == 'en' else 1
+        lang = self._cfg.get('language', 'en')
+        lang_index = _LANG_NAMES.index(lang) if lang in _LANG_NAMES else 0
         self.lang_combo.set_active(lang_index)
         lang_box.pack_start(self.lang_combo, True, True, 0)
         box.pack_start(lang_box, False, False, 0)
@@ -653,58 +882,38 @@ class SettingsDialog(Gtk.Dialog):
         
         # Logo/Title
         title_label = Gtk.Label()
-        title_label.set_markup(
-            '<span size="xx-large" weight="bold">◈ Adhan Live ◈</span>'
-        )
+        title_label.set_markup(_ABOUT_TITLE_MARKUP)
         box.pack_start(title_label, False, False, 10)
-        
+
         # Version
         version_label = Gtk.Label()
-        version_label.set_markup('<span size="large">Version 2.0.0</span>')
+        version_label.set_markup(_ABOUT_VERSION_MARKUP)
         box.pack_start(version_label, False, False, 0)
-        
+
         # Description
         desc_label = Gtk.Label()
-        desc_label.set_markup(
-            '<span size="medium">'
-            'Professional Islamic prayer times display\n'
-            'with beautiful TUI and GUI interfaces'
-            '</span>'
-        )
+        desc_label.set_markup(_ABOUT_DESC_MARKUP)
         desc_label.set_justify(Gtk.Justification.CENTER)
         box.pack_start(desc_label, False, False, 10)
-        
+
         # Features
         features_label = Gtk.Label()
-        features_label.set_markup(
-            '<b>Features:</b>\n'
-            '• Auto-detect location via IP\n'
-            '• Real-time countdown with progress bar\n'
-            '• Desktop notifications\n'
-            '• Hijri and Gregorian dates\n'
-            '• Multi-language support\n'
-            '• Threaded audio playback'
-        )
+        features_label.set_markup(_ABOUT_FEATURES_MARKUP)
         features_label.set_halign(Gtk.Align.START)
         box.pack_start(features_label, False, False, 10)
-        
+
         # Links
         links_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        
+
         github_label = Gtk.Label()
-        github_label.set_markup(
-            '<a href="https://github.com/enzoxwashere/Adhan-Live">◈ GitHub Repository</a>'
-        )
+        github_label.set_markup(_ABOUT_GITHUB_MARKUP)
         links_box.pack_start(github_label, False, False, 0)
-        
+
         box.pack_start(links_box, False, False, 10)
-        
+
         # Copyright
         copyright_label = Gtk.Label()
-        copyright_label.set_markup(
-            '<span size="small">© 2025 Enzo\n'
-            'Licensed under MIT License</span>'
-        )
+        copyright_label.set_markup(_ABOUT_COPYRIGHT_MARKUP)
         copyright_label.set_justify(Gtk.Justification.CENTER)
         box.pack_start(copyright_label, False, False, 0)
         
@@ -755,9 +964,16 @@ class SettingsDialog(Gtk.Dialog):
             dialog.destroy()
             return
         
-        # Test play
+        # Stop a still-running test before starting another
+        if self._test_proc is not None and self._test_proc.poll() is None:
+            self._test_proc.terminate()
+
+        # Test play without blocking the main loop for the clip's duration
         try:
-            subprocess.run(['mpv', '--no-video', '--really-quiet', audio_file], check=False, capture_output=True)
+            self._test_proc = subprocess.Popen(
+                ['mpv', '--no-video', '--really-quiet', audio_file],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
         except Exception as e:
             dialog = Gtk.MessageDialog(
                 transient_for=self,
@@ -771,44 +987,48 @@ class SettingsDialog(Gtk.Dialog):
             dialog.destroy()
     
     def save_settings(self):
-        """Save all settings"""
+        """Save all settings with one write"""
+        # Make sure every deferred page exists before its widgets are read
+        while self._deferred_pages:
+            self._populate_deferred()
+
         # General
-        self.config.set('auto_detect_location', self.auto_detect_check.get_active())
-        self.config.set('calculation_method', self.method_combo.get_active() + 1)
-        self.config.set('retry_attempts', int(self.retry_attempts_spin.get_value()))
-        self.config.set('retry_delay', int(self.retry_delay_spin.get_value()))
-        
+        updates = {
+            'auto_detect_location': self.auto_detect_check.get_active(),
+            'calculation_method': self.method_combo.get_active() + 1,
+            'retry_attempts': int(self.retry_attempts_spin.get_value()),
+            'retry_delay': int(self.retry_delay_spin.get_value())
+        }
+
         # Location
         try:
             new_lat = float(self.lat_entry.get_text())
             new_lon = float(self.lon_entry.get_text())
             new_tz = self.tz_entry.get_text()
-            
-            old_lat = self.config.get('latitude')
-            old_lon = self.config.get('longitude')
-            
-            if new_lat != old_lat or new_lon != old_lon:
+
+            if new_lat != self._cfg.get('latitude') or new_lon != self._cfg.get('longitude'):
                 self.location_changed = True
-                self.config.set('latitude', new_lat)
-                self.config.set('longitude', new_lon)
-                self.config.set('timezone', new_tz)
-                self.config.set('auto_detect_location', False)
+                updates.update({
+                    'latitude': new_lat,
+                    'longitude': new_lon,
+                    'timezone': new_tz,
+                    'auto_detect_location': False
+                })
         except ValueError:
             pass
-        
+
         # Audio
-        self.config.set('mute', self.mute_check.get_active())
-        self.config.set('volume', int(self.volume_scale.get_value()))
-        self.config.set('audio_file', self.audio_entry.get_text())
-        
-        # Appearance
-        theme_index = self.theme_combo.get_active()
-        theme = ['auto', 'light', 'dark'][theme_index]
-        self.config.set('theme', theme)
-        
-        lang_index = self.lang_combo.get_active()
-        lang = 'en' if lang_index == 0 else 'ar'
-        self.config.set('language', lang)
+        updates['mute'] = self.mute_check.get_active()
+        updates['volume'] = int(self.volume_scale.get_value())
+        updates['audio_file'] = self.audio_entry.get_text()
+
+        # Appearance (combos only exist if the tab was opened; if it never
+        # was, the stored values are untouched anyway)
+        if hasattr(self, 'theme_combo'):
+            updates['theme'] = _THEME_NAMES[self.theme_combo.get_active()]
+            updates['language'] = _LANG_NAMES[self.lang_combo.get_active()]
+
+        self.config.set_many(updates)
 
 
 # ============================================================================
@@ -828,7 +1048,35 @@ class AdhanLiveWindow(Gtk.Window):
         
         self.last_played_prayer = None
         self.last_update_date = None
-        
+
+        # Last-rendered markup per label; set_markup is skipped when the
+        # string hasn't changed so Pango only reparses on real transitions
+        self._refresh_location_cache()
+        self._last_location_str = None
+        self._last_day = None
+        self._last_next_prayer_key = None
+
+        # Prayer-window pointers for the progress bar; advanced only when a
+        # prayer passes instead of rescanned every tick
+        self._prev_prayer_time = None
+        self._next_prayer_cache = None
+        self._prev_prayer_epoch = 0
+        self._next_prayer_epoch = 0
+        self._last_progress_tenths = -1
+        self._prayer_timer_id = None
+        self._resize_src = None
+        self._fetch_pending = False
+        self._toast_src = None
+        self._idle_pending = False
+        self._idle_lock = threading.Lock()
+
+        # Persistent prayer-list rows, built once and updated in place
+        self._prayer_rows = {}
+
+        # Redraw work is skipped while the window is iconified
+        self._visible = True
+
+
         # Window settings
         self.set_default_size(
             self.config.get('window_width', 600),
@@ -846,71 +1094,33 @@ class AdhanLiveWindow(Gtk.Window):
         # Initialize data
         self.initialize_data()
         
-        # Start update timer (every second)
-        GLib.timeout_add(1000, self.update_display)
+        # Start update timer (every second), second-aligned so GLib can
+        # coalesce it with other second-granularity timers
+        GLib.timeout_add(1000 - datetime.now().microsecond // 1000, self._start_tick)
         
         # Connect signals
         self.connect("destroy", Gtk.main_quit)
         self.connect("size-allocate", self.on_window_resize)
+        self.connect("window-state-event", self.on_window_state_event)
     
+    # Shared CSS provider; the stylesheet is parsed once per process
+    _css_provider = None
+
     def apply_css(self):
         """Apply custom CSS styling"""
-        css_provider = Gtk.CssProvider()
-        css = b"""
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 10px;
-        }
-        
-        .prayer-box {
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 8px;
-            margin: 5px;
-            border-left: 4px solid #667eea;
-        }
-        
-        .prayer-box-completed {
-            background: #e9ecef;
-            opacity: 0.7;
-        }
-        
-        .next-prayer {
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-            color: white;
-            padding: 20px;
-            border-radius: 10px;
-            margin: 10px 0;
-        }
-        
-        .prayer-name {
-            font-size: 18px;
-            font-weight: bold;
-        }
-        
-        .prayer-time {
-            font-size: 24px;
-            font-weight: bold;
-        }
-        
-        .countdown {
-            font-size: 32px;
-            font-weight: bold;
-        }
-        """
-        css_provider.load_from_data(css)
-        
+        if AdhanLiveWindow._css_provider is None:
+            css_provider = Gtk.CssProvider()
+            css_provider.load_from_data(_ADHAN_CSS)
+            AdhanLiveWindow._css_provider = css_provider
+
         screen = Gdk.Screen.get_default()
         style_context = Gtk.StyleContext()
         style_context.add_provider_for_screen(
             screen,
-            css_provider,
+            AdhanLiveWindow._css_provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
-    
+
     def create_ui(self):
         """Create the user interface"""
         # Main container
@@ -932,6 +1142,14 @@ class AdhanLiveWindow(Gtk.Window):
         # Next prayer panel
         self.next_prayer_box = self.create_next_prayer_panel()
         main_box.pack_start(self.next_prayer_box, False, False, 0)
+
+        # Transient in-window toast; replaces modal status dialogs
+        self.toast = Gtk.InfoBar()
+        self.toast.set_message_type(Gtk.MessageType.INFO)
+        self._toast_label = Gtk.Label()
+        self.toast.get_content_area().add(self._toast_label)
+        self.toast.set_no_show_all(True)
+        main_box.pack_start(self.toast, False, False, 0)
         
         # Control buttons
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
@@ -972,9 +1190,10 @@ class AdhanLiveWindow(Gtk.Window):
         self.date_label = Gtk.Label()
         box.pack_start(self.date_label, False, False, 0)
         
-        # Time
+        # Time (styled once; the tick only swaps the text)
         self.time_label = Gtk.Label()
-        self.time_label.set_markup('<span size="large" weight="bold">--:--:--</span>')
+        self.time_label.set_attributes(_label_attrs(1.2, bold=True))
+        self.time_label.set_text('--:--:--')
         box.pack_start(self.time_label, False, False, 0)
         
         return box
@@ -989,14 +1208,16 @@ class AdhanLiveWindow(Gtk.Window):
         self.next_prayer_name.set_markup('<span size="large" weight="bold">NEXT PRAYER</span>')
         box.pack_start(self.next_prayer_name, False, False, 0)
         
-        # Prayer time
+        # Prayer time (styled once; updates only swap the text)
         self.next_prayer_time = Gtk.Label()
-        self.next_prayer_time.set_markup('<span size="x-large">--:--</span>')
+        self.next_prayer_time.set_attributes(_label_attrs(1.44))
+        self.next_prayer_time.set_text('--:--')
         box.pack_start(self.next_prayer_time, False, False, 0)
-        
+
         # Countdown
         self.countdown_label = Gtk.Label()
-        self.countdown_label.set_markup('<span size="xx-large" weight="bold">--:--:--</span>')
+        self.countdown_label.set_attributes(_label_attrs(1.728, bold=True))
+        self.countdown_label.set_text('--:--:--')
         box.pack_start(self.countdown_label, False, False, 0)
         
         # Progress bar
@@ -1007,17 +1228,52 @@ class AdhanLiveWindow(Gtk.Window):
         return box
     
     def initialize_data(self):
-        """Initialize prayer times data"""
-        def fetch_data():
+        """Initialize prayer times data; concurrent refreshes coalesce"""
+        if self._fetch_pending:
+            return
+        self._fetch_pending = True
+        _FETCH_EXECUTOR.submit(self._do_fetch)
+
+    def _do_fetch(self):
+        try:
             success = self.prayer_manager.update()
-            GLib.idle_add(self.on_data_loaded, success)
-        
-        thread = threading.Thread(target=fetch_data, daemon=True)
-        thread.start()
+        except Exception:
+            success = False
+        finally:
+            self._fetch_pending = False
+
+        # Single-flight: never stack more than one on_data_loaded idle
+        with self._idle_lock:
+            if self._idle_pending:
+                return
+            self._idle_pending = True
+        GLib.idle_add(self.on_data_loaded, success)
     
+    def _refresh_location_cache(self):
+        """Copy location config into locals and pre-render the header line;
+        the tick never touches the config after this"""
+        self._city = self.config.get('city') or 'Unknown'
+        self._country = self.config.get('country') or 'Unknown'
+        self._lat = self.config.get('latitude')
+        self._lon = self.config.get('longitude')
+        if self._lat is None or self._lon is None:
+            self._location_markup = '<span size="small">Loading location...</span>'
+        else:
+            self._location_markup = (
+                f'<span size="small">◉ {self._city}, {self._country} '
+                f'({self._lat:.4f}, {self._lon:.4f})</span>'
+            )
+
     def on_data_loaded(self, success):
         """Called when data is loaded"""
+        with self._idle_lock:
+            self._idle_pending = False
+
         if success:
+            self._refresh_location_cache()
+            self._next_prayer_cache = None
+            self._last_day = None
+            self._schedule_prayer_timer()
             self.update_prayer_list()
             self.update_display()
             self.last_update_date = datetime.now(self.prayer_manager.timezone).date() if self.prayer_manager.timezone else datetime.now().date()
@@ -1035,135 +1291,202 @@ class AdhanLiveWindow(Gtk.Window):
         
         return False
     
-    def update_prayer_list(self):
-        """Update the prayer times list"""
-        # Clear existing prayers
-        for child in self.prayers_box.get_children():
-            self.prayers_box.remove(child)
-        
-        now = datetime.now(self.prayer_manager.timezone) if self.prayer_manager.timezone else datetime.now()
-        
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
-            if prayer not in self.prayer_manager.prayer_times:
-                continue
-            
-            prayer_time = self.prayer_manager.prayer_times[prayer]
+    def _build_prayer_rows(self):
+        """Create the five persistent prayer rows once; updates mutate them"""
+        for prayer in _PRAYER_ORDER:
             icon = self.prayer_manager.PRAYER_ICONS.get(prayer, '◆')
             color = self.prayer_manager.PRAYER_COLORS.get(prayer, '#000000')
-            
-            # Prayer box
+
             prayer_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
             prayer_box.get_style_context().add_class("prayer-box")
-            
-            if prayer_time < now:
-                prayer_box.get_style_context().add_class("prayer-box-completed")
-            
-            # Icon and name
+
+            # Icon and name (static)
             name_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
-            
+
             icon_label = Gtk.Label()
             icon_label.set_markup(f'<span size="x-large" foreground="{color}">{icon}</span>')
             name_box.pack_start(icon_label, False, False, 0)
-            
+
             name_label = Gtk.Label()
             name_label.set_markup(f'<span size="large" weight="bold">{prayer}</span>')
             name_label.set_halign(Gtk.Align.START)
             name_box.pack_start(name_label, False, False, 0)
-            
+
             prayer_box.pack_start(name_box, True, True, 0)
-            
-            # Time
+
+            # Time and status (updated in place)
             time_label = Gtk.Label()
-            time_label.set_markup(f'<span size="x-large" weight="bold">{prayer_time.strftime("%H:%M")}</span>')
             prayer_box.pack_start(time_label, False, False, 0)
-            
-            # Status
+
+            status_label = Gtk.Label()
+            prayer_box.pack_start(status_label, False, False, 0)
+
+            self.prayers_box.pack_start(prayer_box, False, False, 0)
+            self._prayer_rows[prayer] = {
+                'box': prayer_box,
+                'time': time_label,
+                'status': status_label
+            }
+
+        self.prayers_box.show_all()
+
+    def update_prayer_list(self):
+        """Update the prayer times list in place"""
+        if not self._prayer_rows:
+            self._build_prayer_rows()
+
+        now = datetime.now(self.prayer_manager.timezone) if self.prayer_manager.timezone else datetime.now()
+
+        for prayer, row in self._prayer_rows.items():
+            prayer_time = self.prayer_manager.prayer_times.get(prayer)
+            visible = prayer_time is not None
+            if row['box'].get_visible() != visible:
+                row['box'].set_visible(visible)
+            if prayer_time is None:
+                continue
+
+            row['time'].set_markup(f'<span size="x-large" weight="bold">{prayer_time.strftime("%H:%M")}</span>')
+
+            style = row['box'].get_style_context()
             if prayer_time < now:
-                status_label = Gtk.Label()
-                status_label.set_markup('<span foreground="green">✓ Completed</span>')
-                prayer_box.pack_start(status_label, False, False, 0)
+                style.add_class("prayer-box-completed")
+                row['status'].set_markup('<span foreground="green">✓ Completed</span>')
             else:
+                style.remove_class("prayer-box-completed")
                 hours, minutes, _ = self.prayer_manager.get_time_remaining(prayer_time)
-                remaining_label = Gtk.Label()
-                remaining_label.set_markup(f'<span foreground="gray">{hours}h {minutes}m</span>')
-                prayer_box.pack_start(remaining_label, False, False, 0)
-            
-            self.prayers_box.pack_start(prayer_box, False, False, 0)
-        
-        self.prayers_box.show_all()
+                row['status'].set_markup(f'<span foreground="gray">{hours}h {minutes}m</span>')
     
+    def _recompute_prev_prayer(self, now):
+        """Find the most recent elapsed prayer; runs only at crossings"""
+        self._prev_prayer_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        for p in _PRAYER_ORDER_REV:
+            prayer_time = self.prayer_manager.prayer_times.get(p)
+            if prayer_time is not None and prayer_time < now:
+                self._prev_prayer_time = prayer_time
+                break
+
+    def _start_tick(self):
+        """One-shot alignment tick that hands over to the steady 1 Hz timer"""
+        self.update_display()
+        GLib.timeout_add_seconds(1, self.update_display)
+        return False
+
+    def on_window_state_event(self, widget, event):
+        """Track iconified/withdrawn state so hidden ticks stay cheap"""
+        hidden = event.new_window_state & (Gdk.WindowState.ICONIFIED | Gdk.WindowState.WITHDRAWN)
+        self._visible = not hidden
+        return False
+
     def update_display(self):
         """Update the display (called every second)"""
-        # Update time - use timezone if available
-        now = datetime.now(self.prayer_manager.timezone) if self.prayer_manager.timezone else datetime.now()
-        self.time_label.set_markup(f'<span size="large" weight="bold">{now.strftime("%H:%M:%S")}</span>')
-        
-        # Update date
-        date_str = now.strftime("%A, %B %d, %Y")
-        hijri_str = self.prayer_manager.hijri_date if self.prayer_manager.hijri_date else ""
-        self.date_label.set_markup(f'<span size="small">◆ {date_str}\n◐ {hijri_str}</span>')
-        
-        # Update location
-        city = self.config.get('city', 'Unknown')
-        country = self.config.get('country', 'Unknown')
-        lat = self.config.get('latitude', 0)
-        lon = self.config.get('longitude', 0)
-        self.location_label.set_markup(f'<span size="small">◉ {city}, {country} ({lat:.4f}, {lon:.4f})</span>')
-        
-        # Update next prayer
-        next_prayer_data = self.prayer_manager.get_next_prayer()
-        if next_prayer_data:
-            prayer, prayer_time = next_prayer_data
-            icon = self.prayer_manager.PRAYER_ICONS.get(prayer, '◆')
-            
-            self.next_prayer_name.set_markup(f'<span size="large" weight="bold">{icon} NEXT PRAYER: {prayer.upper()} {icon}</span>')
-            self.next_prayer_time.set_markup(f'<span size="x-large">◷ {prayer_time.strftime("%H:%M")}</span>')
-            
-            hours, minutes, seconds = self.prayer_manager.get_time_remaining(prayer_time)
-            self.countdown_label.set_markup(f'<span size="xx-large" weight="bold">◵ {hours:02d}:{minutes:02d}:{seconds:02d}</span>')
-            
-            # Update progress bar
-            total_seconds = (prayer_time - now).total_seconds()
-            prev_prayer_time = now.replace(hour=0, minute=0, second=0)
-            for p in ['Isha', 'Maghrib', 'Asr', 'Dhuhr', 'Fajr']:
-                if p in self.prayer_manager.prayer_times and self.prayer_manager.prayer_times[p] < now:
-                    prev_prayer_time = self.prayer_manager.prayer_times[p]
-                    break
-            
-            total_duration = (prayer_time - prev_prayer_time).total_seconds()
-            elapsed = (now - prev_prayer_time).total_seconds()
-            progress = min(1.0, max(0.0, elapsed / total_duration)) if total_duration > 0 else 0
-            
-            self.progress_bar.set_fraction(progress)
-            self.progress_bar.set_text(f"{progress * 100:.1f}%")
-        
-        # Check for prayer time
-        self.check_prayer_time()
-        
-        # Check if date changed - use timezone if available
-        current_date = datetime.now(self.prayer_manager.timezone).date() if self.prayer_manager.timezone else datetime.now().date()
+        tz = self.prayer_manager.timezone
+        now = datetime.now(tz) if tz else datetime.now()
+
+        # While hidden, keep the midnight rollover alive but skip all of
+        # the label/progress redraw work (the adhan timer fires on its own)
+        if not self._visible:
+            if self.last_update_date and self.last_update_date != now.date():
+                self.initialize_data()
+            return True
+
+        # Batch the per-tick property writes so GTK coalesces them
+        # into a single notify/redraw cycle
+        self.freeze_child_notify()
+        try:
+            # Update time - integer formatting beats strftime for a clock
+            self.time_label.set_text(f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}")
+
+            # Format the date line only when the day (or hijri data) changes
+            if now.toordinal() != self._last_day:
+                self._last_day = now.toordinal()
+                date_str = now.strftime("%A, %B %d, %Y")
+                hijri_str = self.prayer_manager.hijri_date if self.prayer_manager.hijri_date else ""
+                self.date_label.set_markup(f'<span size="small">◆ {date_str}\n◐ {hijri_str}</span>')
+
+            # Update location from the pre-rendered markup (refreshed on data
+            # load and settings changes, not per tick)
+            if self._location_markup != self._last_location_str:
+                self._last_location_str = self._location_markup
+                self.location_label.set_markup(self._location_markup)
+
+            # Update next prayer
+            next_prayer_data = self.prayer_manager.get_next_prayer()
+            if next_prayer_data:
+                prayer, prayer_time = next_prayer_data
+
+                if (prayer, prayer_time) != self._last_next_prayer_key:
+                    self._last_next_prayer_key = (prayer, prayer_time)
+                    icon = self.prayer_manager.PRAYER_ICONS.get(prayer, '◆')
+                    self.next_prayer_name.set_markup(f'<span size="large" weight="bold">{icon} NEXT PRAYER: {prayer.upper()} {icon}</span>')
+                    self.next_prayer_time.set_text(f'◷ {prayer_time.strftime("%H:%M")}')
+
+                # Refresh the prayer window epochs only at crossings
+                if self._next_prayer_cache is None or self._next_prayer_cache[1] != prayer_time:
+                    self._next_prayer_cache = (prayer, prayer_time)
+                    self._recompute_prev_prayer(now)
+                    self._next_prayer_epoch = int(prayer_time.timestamp())
+                    self._prev_prayer_epoch = int(self._prev_prayer_time.timestamp())
+
+                # Countdown and progress on integer seconds
+                now_ts = int(time.time())
+                remaining = max(0, self._next_prayer_epoch - now_ts)
+                hours, rem = divmod(remaining, 3600)
+                minutes, seconds = divmod(rem, 60)
+                self.countdown_label.set_text(_COUNTDOWN_FMT % (hours, minutes, seconds))
+
+                total_duration = self._next_prayer_epoch - self._prev_prayer_epoch
+                elapsed = now_ts - self._prev_prayer_epoch
+                progress = min(1.0, max(0.0, elapsed / total_duration)) if total_duration > 0 else 0
+
+                # The bar only shows tenths of a percent; don't touch the widget
+                # until the displayed value actually moves
+                tenths = int(progress * 1000)
+                if tenths != self._last_progress_tenths:
+                    self._last_progress_tenths = tenths
+                    self.progress_bar.set_fraction(progress)
+                    self.progress_bar.set_text(f"{tenths / 10:.1f}%")
+        
+        finally:
+            self.thaw_child_notify()
+
+        # Check if date changed - derived from the "now" computed above
+        current_date = now.date()
         if self.last_update_date and self.last_update_date != current_date:
             self.initialize_data()
-        
+
         return True
-    
-    def check_prayer_time(self):
-        """Check if it's prayer time"""
-        if not self.prayer_manager.prayer_times:
+
+    def _schedule_prayer_timer(self):
+        """Arm a one-shot timer for the next prayer instead of polling"""
+        if self._prayer_timer_id is not None:
+            GLib.source_remove(self._prayer_timer_id)
+            self._prayer_timer_id = None
+
+        next_prayer = self.prayer_manager.get_next_prayer()
+        if not next_prayer:
             return
-        
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
-            if self.prayer_manager.is_prayer_time(prayer) and prayer != self.last_played_prayer:
-                audio_file = self.config.get('audio_file')
-                self.audio_player.play(audio_file)
-                
-                self.audio_player.send_notification(
-                    "◈ Adhan Live",
-                    f"It's time for {prayer} prayer!"
-                )
-                
-                self.last_played_prayer = prayer
-                break
+
+        prayer, prayer_time = next_prayer
+        delay = max(1, int(prayer_time.timestamp()) - int(time.time()))
+        self._prayer_timer_id = GLib.timeout_add_seconds(delay, self._on_prayer_due, prayer)
+
+    def _on_prayer_due(self, prayer):
+        """Fired exactly at prayer time; plays the adhan and re-arms"""
+        self._prayer_timer_id = None
+
+        if prayer != self.last_played_prayer:
+            audio_file = self.config.get('audio_file')
+            self.audio_player.play(audio_file)
+
+            self.audio_player.send_notification(
+                "◈ Adhan Live",
+                f"It's time for {prayer} prayer!"
+            )
+
+            self.last_played_prayer = prayer
+
+        self._schedule_prayer_timer()
+        return False
     
     def on_refresh_clicked(self, button):
         """Refresh button clicked"""
@@ -1173,17 +1496,29 @@ class AdhanLiveWindow(Gtk.Window):
         """Mute button clicked"""
         current_mute = self.config.get('mute', False)
         self.config.set('mute', not current_mute)
-        
+
         status = "muted" if not current_mute else "unmuted"
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.INFO,
-            buttons=Gtk.ButtonsType.OK,
-            text=f"Sound {status}"
-        )
-        dialog.run()
-        dialog.destroy()
+        self._show_toast(f"◈ Sound {status}")
+
+    def _show_toast(self, message):
+        """Show a short-lived notice without a modal loop; the 1 Hz tick
+        keeps running underneath"""
+        self._toast_label.set_text(message)
+        # no-show-all keeps the bar hidden at startup but also makes
+        # show_all() a no-op, so show the bar and its content explicitly
+        self.toast.show()
+        self.toast.get_content_area().show_all()
+        self.toast.set_revealed(True)
+
+        if self._toast_src is not None:
+            GLib.source_remove(self._toast_src)
+        self._toast_src = GLib.timeout_add_seconds(2, self._hide_toast)
+
+    def _hide_toast(self):
+        self._toast_src = None
+        self.toast.set_revealed(False)
+        self.toast.hide()
+        return False
     
     def on_settings_clicked(self, button):
         """Settings button clicked"""
@@ -1192,6 +1527,7 @@ class AdhanLiveWindow(Gtk.Window):
         
         if response == Gtk.ResponseType.OK:
             settings_dialog.save_settings()
+            self._refresh_location_cache()
             # Refresh prayer times if location changed
             if settings_dialog.location_changed:
                 self.initialize_data()
@@ -1199,11 +1535,18 @@ class AdhanLiveWindow(Gtk.Window):
         settings_dialog.destroy()
     
     def on_window_resize(self, widget, allocation):
-        """Save window size on resize"""
-        width = allocation.width
-        height = allocation.height
-        self.config.set('window_width', width)
-        self.config.set('window_height', height)
+        """Save window size on resize, debounced; GTK emits size-allocate
+        continuously during a drag and each save hits the config file"""
+        if self._resize_src is not None:
+            GLib.source_remove(self._resize_src)
+        self._resize_src = GLib.timeout_add(
+            500, self._commit_window_size, allocation.width, allocation.height
+        )
+
+    def _commit_window_size(self, width, height):
+        self._resize_src = None
+        self.config.set_many({'window_width': width, 'window_height': height})
+        return False
 
 
 # ============================================================================
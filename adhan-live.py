@@ -8,11 +8,16 @@ import os
 import sys
 import json
 import time
+import atexit
+import sched
+import shutil
+import asyncio
 import argparse
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date, time as dt_time
 from typing import Dict, Optional, Tuple
 
 try:
@@ -22,10 +27,19 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: 'requests' module not found. Install it with: pip install requests")
     sys.exit(1)
 
+# Optional: when httpx is available the cold-start requests are issued
+# concurrently on an event loop instead of serially blocking threads
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 try:
     from rich.console import Console
     from rich.table import Table
@@ -42,6 +56,31 @@ except ImportError:
 # Initialize console for error messages
 console = Console()
 
+# Canonical prayer ordering, shared by every lookup and render loop
+PRAYER_ORDER = ('Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha')
+PRAYER_ORDER_REV = tuple(reversed(PRAYER_ORDER))
+
+# IP geolocation barely changes hour to hour; re-query at most this often
+# (also keeps us well inside ip-api.com's free-tier rate limit)
+LOCATION_CACHE_TTL = 6 * 3600
+
+# Every possible fill state of the countdown progress bar, precomputed so
+# the render loop does one tuple index instead of building strings
+_BAR_WIDTH = 40
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+# ZoneInfo objects are cached per tz name; constructing one reads tzdata
+# from disk, which is wasteful when the name never changes between updates
+_TZ_CACHE: Dict[str, ZoneInfo] = {}
+
+
+def _get_tz(name: str) -> Optional[ZoneInfo]:
+    """Return a cached ZoneInfo for name, or None if the name is invalid"""
+    try:
+        return _TZ_CACHE.setdefault(name, ZoneInfo(name))
+    except Exception:
+        return None
+
 
 # ============================================================================
 # Configuration Manager
@@ -68,11 +107,18 @@ class ConfigManager:
         "retry_delay": 2
     }
     
+    SAVE_DELAY = 1.0
+
     def __init__(self):
         self.config_dir = Path.home() / ".config" / "adhan-live"
         self.config_file = self.config_dir / "config.json"
         self.config = self.load()
-    
+        self._dirty = False
+        self._dir_ready = False
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        atexit.register(self.flush)
+
     def load(self) -> Dict:
         """Load configuration from file"""
         if self.config_file.exists():
@@ -83,21 +129,62 @@ class ConfigManager:
             except Exception:
                 return self.DEFAULT_CONFIG.copy()
         return self.DEFAULT_CONFIG.copy()
-    
-    def save(self):
-        """Save configuration to file"""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=4, ensure_ascii=False)
-    
+
+    def save(self, snapshot: Optional[Dict] = None):
+        """Save configuration to file (write-to-tmp then atomic replace)
+
+        Dumps a point-in-time copy so concurrent set()/set_many() calls
+        from other threads cannot mutate the dict mid-serialization.
+        """
+        if snapshot is None:
+            snapshot = dict(self.config)
+        if not self._dir_ready:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        tmp = self.config_file.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, indent=4, ensure_ascii=False)
+        os.replace(tmp, self.config_file)
+
+    def flush(self):
+        """Write any pending changes to disk immediately"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            snapshot = dict(self.config)
+        try:
+            self.save(snapshot)
+        except Exception:
+            # Keep the changes pending so a later flush retries them
+            with self._save_lock:
+                self._dirty = True
+
+    def _schedule_save(self):
+        """Mark the config dirty and coalesce writes into one delayed save"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
     def get(self, key: str, default=None):
         """Get configuration value"""
         return self.config.get(key, default)
-    
+
     def set(self, key: str, value):
         """Set configuration value"""
         self.config[key] = value
-        self.save()
+        self._schedule_save()
+
+    def set_many(self, updates: Dict):
+        """Set several configuration values with a single save"""
+        self.config.update(updates)
+        self._schedule_save()
 
 
 # ============================================================================
@@ -107,16 +194,79 @@ class ConfigManager:
 class PrayerTimesAPI:
     """Handles API calls to Aladhan API"""
     
-    BASE_URL = "http://api.aladhan.com/v1"
+    BASE_URL = "https://api.aladhan.com/v1"
     LOCATION_API = "http://ip-api.com/json/"
-    
+
+    CACHE_MAX_AGE_DAYS = 7
+
     def __init__(self, config: ConfigManager):
         self.config = config
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': 'AdhanLive/2.0'})
-    
+        # Pool connections across the location/timings/prefetch calls and
+        # back off politely on 429s instead of hammering the APIs
+        retry = Retry(
+            total=3,
+            backoff_factor=0.4,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET'])
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.cache_dir = Path.home() / ".config" / "adhan-live" / "cache"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._last_location = None
+        self._loc_cache = None
+        self._loc_cache_ts = 0.0
+
+    def __del__(self):
+        try:
+            self._executor.shutdown(wait=False)
+        except Exception:
+            pass
+
+    def _cache_path(self, date: datetime, lat, lon, method) -> Path:
+        """Build cache file path for a (date, location, method) combination"""
+        key = f"{date:%Y-%m-%d}_{float(lat):.4f}_{float(lon):.4f}_{method}.json"
+        return self.cache_dir / key
+
+    def _read_cache(self, path: Path) -> Optional[Dict]:
+        """Read cached prayer times, returning None on miss or corruption"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def _write_cache(self, path: Path, data: Dict):
+        """Write prayer times to cache atomically"""
+        try:
+            tmp = path.with_suffix('.tmp')
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+            tmp.replace(path)
+        except Exception:
+            pass
+
+    def _prune_cache(self):
+        """Remove cache entries older than CACHE_MAX_AGE_DAYS"""
+        cutoff = (datetime.now() - timedelta(days=self.CACHE_MAX_AGE_DAYS)).strftime('%Y-%m-%d')
+        try:
+            for entry in self.cache_dir.glob('*.json'):
+                if entry.name[:10] < cutoff:
+                    entry.unlink(missing_ok=True)
+        except Exception:
+            pass
+
     def get_location(self) -> Optional[Dict]:
         """Get location from IP with retry logic"""
+        if self._loc_cache and time.time() - self._loc_cache_ts < LOCATION_CACHE_TTL:
+            return self._loc_cache
+
         retry_attempts = self.config.get('retry_attempts', 3)
         retry_delay = self.config.get('retry_delay', 2)
         
@@ -141,8 +291,12 @@ class PrayerTimesAPI:
                         'timezone': data.get('timezone')
                     }
                     # Save to config
-                    self.config.set('city', location['city'])
-                    self.config.set('country', location['country'])
+                    self.config.set_many({
+                        'city': location['city'],
+                        'country': location['country']
+                    })
+                    self._loc_cache = location
+                    self._loc_cache_ts = time.time()
                     return location
                     
             except requests.RequestException as e:
@@ -156,42 +310,168 @@ class PrayerTimesAPI:
         console.print("[red]Failed to detect location after all attempts[/red]")
         return None
     
+    async def _get_location_async(self, client) -> Optional[Dict]:
+        """httpx coroutine mirroring get_location (single attempt)"""
+        try:
+            response = await client.get(self.LOCATION_API)
+            response.raise_for_status()
+            data = response.json()
+            if data.get('status') == 'success':
+                return {
+                    'city': data.get('city', 'Unknown'),
+                    'country': data.get('country', 'Unknown'),
+                    'lat': data.get('lat'),
+                    'lon': data.get('lon'),
+                    'timezone': data.get('timezone')
+                }
+        except Exception:
+            pass
+        return None
+
+    async def _get_timings_async(self, client, date: datetime, lat, lon) -> Optional[Dict]:
+        """httpx coroutine mirroring _request_timings, disk cache included"""
+        method = self.config.get('calculation_method', 4)
+        cache_path = self._cache_path(date, lat, lon, method)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached
+
+        try:
+            url = f"{self.BASE_URL}/timings/{date.strftime('%d-%m-%Y')}"
+            params = {'latitude': lat, 'longitude': lon, 'method': method}
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            if data.get('code') == 200:
+                self._write_cache(cache_path, data['data'])
+                return data['data']
+        except Exception:
+            pass
+        return None
+
+    async def fetch_async(self, date: Optional[datetime] = None) -> Optional[Dict]:
+        """Fetch location and timings concurrently on an event loop"""
+        if date is None:
+            date = datetime.now()
+
+        async with httpx.AsyncClient(timeout=10, headers={'User-Agent': 'AdhanLive/2.0'}) as client:
+            loc_task = None
+            if self.config.get('auto_detect_location'):
+                if self._loc_cache and time.time() - self._loc_cache_ts < LOCATION_CACHE_TTL:
+                    self._last_location = self._loc_cache
+                else:
+                    loc_task = asyncio.ensure_future(self._get_location_async(client))
+
+            lat = self.config.get('latitude')
+            lon = self.config.get('longitude')
+            timings_task = None
+            if lat and lon:
+                timings_task = asyncio.ensure_future(self._get_timings_async(client, date, lat, lon))
+
+            location = await loc_task if loc_task is not None else None
+            if location:
+                self._last_location = location
+                self._loc_cache = location
+                self._loc_cache_ts = time.time()
+                self.config.set_many({
+                    'city': location['city'],
+                    'country': location['country'],
+                    'latitude': location['lat'],
+                    'longitude': location['lon'],
+                    'timezone': location['timezone']
+                })
+                if timings_task is not None and (location['lat'], location['lon']) != (lat, lon):
+                    timings_task.cancel()
+                    timings_task = None
+                lat, lon = location['lat'], location['lon']
+
+            if timings_task is not None:
+                return await timings_task
+
+            if not lat or not lon:
+                console.print("[red]No location coordinates available. Please configure manually.[/red]")
+                return None
+
+            return await self._get_timings_async(client, date, lat, lon)
+
     def fetch_prayer_times(self, date: Optional[datetime] = None) -> Optional[Dict]:
         """Fetch prayer times from API with retry logic"""
         if date is None:
             date = datetime.now()
-        
+
+        # Prefer the concurrent httpx path when the dependency is present
+        # and we are not already inside an event loop
+        if httpx is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                try:
+                    return asyncio.run(self.fetch_async(date))
+                except Exception:
+                    pass
+
         if self.config.get('auto_detect_location'):
-            location = self.get_location()
+            # Geolocate and fetch timings for the last-known coordinates in
+            # parallel; the timings result is discarded only if the location
+            # actually changed.
+            loc_future = self._executor.submit(self.get_location)
+            known_lat = self.config.get('latitude')
+            known_lon = self.config.get('longitude')
+            timings_future = None
+            if known_lat and known_lon:
+                timings_future = self._executor.submit(self._request_timings, date, known_lat, known_lon)
+
+            location = loc_future.result()
+            self._last_location = location
             if location:
-                self.config.set('latitude', location['lat'])
-                self.config.set('longitude', location['lon'])
-                self.config.set('timezone', location['timezone'])
-        
+                self.config.set_many({
+                    'latitude': location['lat'],
+                    'longitude': location['lon'],
+                    'timezone': location['timezone']
+                })
+                if timings_future is not None:
+                    if (location['lat'], location['lon']) == (known_lat, known_lon):
+                        return timings_future.result()
+                    timings_future.cancel()
+            elif timings_future is not None:
+                return timings_future.result()
+
         lat = self.config.get('latitude')
         lon = self.config.get('longitude')
-        
+
         if not lat or not lon:
             console.print("[red]No location coordinates available. Please configure manually.[/red]")
             return None
-        
+
+        return self._request_timings(date, lat, lon)
+
+    def _request_timings(self, date: datetime, lat, lon) -> Optional[Dict]:
+        """Fetch timings for known coordinates, using the disk cache first"""
+        method = self.config.get('calculation_method', 4)
+        cache_path = self._cache_path(date, lat, lon, method)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached
+
         retry_attempts = self.config.get('retry_attempts', 3)
         retry_delay = self.config.get('retry_delay', 2)
-        
+
         for attempt in range(retry_attempts):
             try:
                 url = f"{self.BASE_URL}/timings/{date.strftime('%d-%m-%Y')}"
                 params = {
                     'latitude': lat,
                     'longitude': lon,
-                    'method': self.config.get('calculation_method', 4)
+                    'method': method
                 }
-                
+
                 response = self.session.get(url, params=params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
-                
+
                 if data.get('code') == 200:
+                    self._write_cache(cache_path, data['data'])
+                    self._prune_cache()
                     return data['data']
                 else:
                     console.print(f"[yellow]API returned error code: {data.get('code')} (attempt {attempt + 1}/{retry_attempts})[/yellow]")
@@ -230,15 +510,44 @@ class PrayerTimesManager:
         'Maghrib': '◖',
         'Isha': '◕'
     }
-    
+
+    # One lookup for renderers that need both color and icon
+    PRAYER_STYLE = {
+        'Fajr': ('magenta', '◗'),
+        'Dhuhr': ('yellow', '◉'),
+        'Asr': ('cyan', '◐'),
+        'Maghrib': ('red', '◖'),
+        'Isha': ('blue', '◕')
+    }
+
     def __init__(self, config: ConfigManager):
         self.config = config
         self.api = PrayerTimesAPI(config)
         self.prayer_times: Dict[str, datetime] = {}
+        self.prayer_display: Dict[str, str] = {}
         self.hijri_date = ""
+        self.header_static_lines: Tuple[str, ...] = ()
         self.location_data = None
         self.timezone = None
-    
+        self._now = None
+        self._now_ts = 0.0
+        self._boundary_cache = None
+
+    def now(self) -> datetime:
+        """Current time in the configured timezone, memoized for 500 ms
+
+        Rendering one frame asks for "now" up to a dozen times; they should
+        all see the same instant and pay for tz resolution only once.
+        """
+        if self._now is None or time.monotonic() - self._now_ts >= 0.5:
+            self._now = datetime.now(self.timezone) if self.timezone else datetime.now()
+            self._now_ts = time.monotonic()
+        return self._now
+
+    def _invalidate_now(self):
+        """Force the next now() call to take a fresh reading"""
+        self._now = None
+
     def update(self) -> bool:
         """Update prayer times from API"""
         data = self.api.fetch_prayer_times()
@@ -246,38 +555,100 @@ class PrayerTimesManager:
             return False
         
         tz_name = self.config.get('timezone')
-        if tz_name:
-            try:
-                self.timezone = ZoneInfo(tz_name)
-            except Exception:
-                self.timezone = None
-        
+        self.timezone = _get_tz(tz_name) if tz_name else None
+
         timings = data.get('timings', {})
-        date_obj = datetime.now(self.timezone) if self.timezone else datetime.now()
-        
+        self._invalidate_now()
+
+        # Anchor prayer datetimes to the Gregorian date the API says the
+        # timings belong to (DD-MM-YYYY); deriving the day from "now" puts
+        # everything on the wrong date when an update runs near midnight
+        try:
+            greg = data['date']['gregorian']['date']
+            day, month, year = map(int, greg.split('-'))
+            base_date = date(year, month, day)
+        except Exception:
+            base_date = self.now().date()
+
         self.prayer_times = {}
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
+        self.prayer_display = {}
+        for prayer in PRAYER_ORDER:
             if prayer in timings:
-                time_str = timings[prayer].split()[0]
+                # Timings arrive as "HH:MM" with an optional " (UTC)" style
+                # suffix; slicing tolerates stray whitespace without the
+                # double split+map allocation dance
+                time_str = timings[prayer]
                 try:
-                    hour, minute = map(int, time_str.split(':'))
-                    prayer_time = date_obj.replace(hour=hour, minute=minute, second=0, microsecond=0)
+                    hour, minute = int(time_str[0:2]), int(time_str[3:5])
+                    prayer_time = datetime.combine(base_date, dt_time(hour, minute), tzinfo=self.timezone)
                     self.prayer_times[prayer] = prayer_time
+                    self.prayer_display[prayer] = prayer_time.strftime('%H:%M')
                 except Exception:
                     pass
         
+        self._boundary_cache = None
+
         hijri = data.get('date', {}).get('hijri', {})
         self.hijri_date = f"{hijri.get('day', '')} {hijri.get('month', {}).get('en', '')} {hijri.get('year', '')}"
-        
-        self.location_data = self.api.get_location()
-        
+
+        # fetch_prayer_times already geolocated (or the coordinates came
+        # from config) — no need for a second ip-api round-trip here
+        location = self.api._last_location
+        if location is None:
+            location = {
+                'city': self.config.get('city', 'Unknown'),
+                'country': self.config.get('country', 'Unknown'),
+                'lat': self.config.get('latitude'),
+                'lon': self.config.get('longitude'),
+                'timezone': self.config.get('timezone')
+            }
+        self.location_data = location
+
+        # Header lines that only change when the data itself changes are
+        # assembled here once instead of on every render tick
+        static_lines = []
+        if location:
+            static_lines.append(f"◉ Location: {location.get('city', 'Unknown')}, {location.get('country', 'Unknown')}")
+            static_lines.append(f"◈ Coordinates: {location.get('lat', 0):.4f}, {location.get('lon', 0):.4f}")
+        if self.hijri_date.strip():
+            static_lines.append(f"◐ Hijri: {self.hijri_date}")
+        self.header_static_lines = tuple(static_lines)
+
         return True
     
+    def _recompute_boundaries(self, now: datetime):
+        """Recompute the (previous, next) prayer pair framing this moment"""
+        next_prayer_data = self.get_next_prayer()
+        if not next_prayer_data:
+            self._boundary_cache = None
+            return
+
+        next_name, next_time = next_prayer_data
+        prev_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        for p in PRAYER_ORDER_REV:
+            if p in self.prayer_times and self.prayer_times[p] < now:
+                prev_time = self.prayer_times[p]
+                break
+
+        total_duration = (next_time - prev_time).total_seconds()
+        self._boundary_cache = (prev_time, next_name, next_time, total_duration)
+
+    def get_boundaries(self, now: datetime) -> Optional[Tuple[datetime, str, datetime, float]]:
+        """Previous prayer time, next prayer name/time and interval length
+
+        The boundaries only move when a prayer time is crossed, so they are
+        cached rather than rescanned on every tick.
+        """
+        cache = self._boundary_cache
+        if cache is None or now >= cache[2]:
+            self._recompute_boundaries(now)
+        return self._boundary_cache
+
     def get_next_prayer(self) -> Optional[Tuple[str, datetime]]:
         """Get next prayer name and time"""
-        now = datetime.now(self.timezone) if self.timezone else datetime.now()
+        now = self.now()
         
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
+        for prayer in PRAYER_ORDER:
             if prayer in self.prayer_times:
                 prayer_time = self.prayer_times[prayer]
                 if prayer_time > now:
@@ -291,7 +662,7 @@ class PrayerTimesManager:
     
     def get_time_remaining(self, target_time: datetime) -> Tuple[int, int, int]:
         """Calculate time remaining until target"""
-        now = datetime.now(self.timezone) if self.timezone else datetime.now()
+        now = self.now()
         diff = target_time - now
         
         if diff.total_seconds() < 0:
@@ -308,7 +679,7 @@ class PrayerTimesManager:
         if prayer not in self.prayer_times:
             return False
         
-        now = datetime.now(self.timezone) if self.timezone else datetime.now()
+        now = self.now()
         prayer_time = self.prayer_times[prayer]
         
         return abs((now - prayer_time).total_seconds()) < 60
@@ -320,12 +691,24 @@ class PrayerTimesManager:
 
 class AudioPlayer:
     """Handles audio playback in separate thread"""
-    
+
+    PLAYER_CANDIDATES = (
+        ('mpv', '--no-video', '--really-quiet'),
+        ('ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet'),
+        ('mpg123', '-q')
+    )
+
     def __init__(self, config: ConfigManager):
         self.config = config
         self.is_playing = False
         self.thread = None
-    
+        # Resolve the player binary once instead of shelling out to
+        # `which` for every candidate each time the adhan fires
+        self._player_cmd = next(
+            (list(cmd) for cmd in self.PLAYER_CANDIDATES if shutil.which(cmd[0])),
+            None
+        )
+
     def play(self, audio_file: str):
         """Play audio file in separate thread"""
         if self.config.get('mute', False):
@@ -339,25 +722,15 @@ class AudioPlayer:
     
     def _play_audio(self, audio_file: str):
         """Internal method to play audio"""
-        if not Path(audio_file).exists():
+        if self._player_cmd is None or not Path(audio_file).exists():
             return
-        
+
         self.is_playing = True
-        
+
         try:
-            players = [
-                (['mpv', '--no-video', '--really-quiet', audio_file], True),
-                (['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet', audio_file], True),
-                (['mpg123', '-q', audio_file], True)
-            ]
-            
-            for cmd, _ in players:
-                try:
-                    if subprocess.run(['which', cmd[0]], capture_output=True).returncode == 0:
-                        subprocess.run(cmd, check=False, capture_output=True)
-                        break
-                except Exception:
-                    continue
+            subprocess.run(self._player_cmd + [audio_file], check=False, capture_output=True)
+        except Exception:
+            pass
         finally:
             self.is_playing = False
     
@@ -382,37 +755,35 @@ class AudioPlayer:
 class UIRenderer:
     """Renders the TUI using Rich library"""
     
-    def __init__(self, prayer_manager: PrayerTimesManager):
+    def __init__(self, prayer_manager: PrayerTimesManager, ui_console: Optional[Console] = None):
         self.prayer_manager = prayer_manager
-        self.console = Console()
-    
+        # Console is process-wide terminal state; share the module instance
+        # instead of probing the tty and color support again
+        self.console = ui_console if ui_console is not None else console
+        self._layout = None
+        self._header_date = None
+        self._date_line = ""
+        self._last_sig = None
+
     def create_header(self) -> Panel:
         """Create header panel"""
         pm = self.prayer_manager
-        
+
         title = Text("◈ ADHAN LIVE - PRAYER TIMES ◈", style="bold cyan", justify="center")
-        
-        info_lines = []
-        
-        if pm.location_data:
-            city = pm.location_data.get('city', 'Unknown')
-            country = pm.location_data.get('country', 'Unknown')
-            lat = pm.location_data.get('lat', 0)
-            lon = pm.location_data.get('lon', 0)
-            
-            info_lines.append(f"◉ Location: {city}, {country}")
-            info_lines.append(f"◈ Coordinates: {lat:.4f}, {lon:.4f}")
-        
-        now = datetime.now()
-        info_lines.append(f"◆ Date: {now.strftime('%A, %B %d, %Y')}")
-        
-        if pm.hijri_date:
-            info_lines.append(f"◐ Hijri: {pm.hijri_date}")
-        
+
+        now = pm.now()
+        if self._header_date != now.date():
+            self._header_date = now.date()
+            self._date_line = f"◆ Date: {now.strftime('%A, %B %d, %Y')}"
+
+        # Location/coordinates/hijri lines are prebuilt by update();
+        # only the date (daily) and clock (every second) lines vary here
+        info_lines = list(pm.header_static_lines)
+        info_lines.append(self._date_line)
         info_lines.append(f"◷ Time: {now.strftime('%H:%M:%S')}")
-        
+
         content = "\n".join(info_lines)
-        
+
         return Panel(content, title=title, border_style="cyan", box=box.DOUBLE)
     
     def create_prayer_table(self) -> Table:
@@ -434,15 +805,14 @@ class UIRenderer:
         table.add_column("Time", style="bold", width=10)
         table.add_column("Status", style="dim", width=15)
         
-        now = datetime.now(pm.timezone) if pm.timezone else datetime.now()
+        now = pm.now()
         
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
+        for prayer in PRAYER_ORDER:
             if prayer not in pm.prayer_times:
                 continue
-            
+
             prayer_time = pm.prayer_times[prayer]
-            color = pm.PRAYER_COLORS.get(prayer, 'white')
-            icon = pm.PRAYER_ICONS.get(prayer, '🕌')
+            color, icon = pm.PRAYER_STYLE.get(prayer, ('white', '🕌'))
             
             if prayer_time < now:
                 status = "✓"
@@ -461,7 +831,7 @@ class UIRenderer:
                 f"[{status_style}]{status}[/]",
                 icon,
                 f"[{color}]{prayer}[/]",
-                f"[{time_style}]{prayer_time.strftime('%H:%M')}[/]",
+                f"[{time_style}]{pm.prayer_display[prayer]}[/]",
                 f"[dim]{remaining}[/]"
             )
         
@@ -471,39 +841,28 @@ class UIRenderer:
         """Create next prayer panel with progress bar"""
         pm = self.prayer_manager
         
-        next_prayer_data = pm.get_next_prayer()
-        if not next_prayer_data:
+        now = pm.now()
+        boundaries = pm.get_boundaries(now)
+        if not boundaries:
             return None
-        
-        prayer, prayer_time = next_prayer_data
+
+        prev_prayer_time, prayer, prayer_time, total_duration = boundaries
         hours, minutes, seconds = pm.get_time_remaining(prayer_time)
-        
-        color = pm.PRAYER_COLORS.get(prayer, 'white')
-        icon = pm.PRAYER_ICONS.get(prayer, '◆')
+
+        color, icon = pm.PRAYER_STYLE.get(prayer, ('white', '◆'))
         
         lines = []
         lines.append(f"◈ {icon}  [bold {color}]NEXT PRAYER: {prayer.upper()}[/]  {icon} ◈")
         lines.append("")
-        lines.append(f"◷ Time: [bold white]{prayer_time.strftime('%H:%M')}[/]")
+        lines.append(f"◷ Time: [bold white]{pm.prayer_display.get(prayer, prayer_time.strftime('%H:%M'))}[/]")
         lines.append("")
         lines.append(f"◵ Countdown: [bold green]{hours:02d}[/]h [bold green]{minutes:02d}[/]m [bold green]{seconds:02d}[/]s")
-        
-        now = datetime.now(pm.timezone) if pm.timezone else datetime.now()
-        total_seconds = (prayer_time - now).total_seconds()
-        
-        prev_prayer_time = now.replace(hour=0, minute=0, second=0)
-        for p in ['Isha', 'Maghrib', 'Asr', 'Dhuhr', 'Fajr']:
-            if p in pm.prayer_times and pm.prayer_times[p] < now:
-                prev_prayer_time = pm.prayer_times[p]
-                break
-        
-        total_duration = (prayer_time - prev_prayer_time).total_seconds()
+
         elapsed = (now - prev_prayer_time).total_seconds()
         progress_percent = min(100, max(0, (elapsed / total_duration) * 100)) if total_duration > 0 else 0
         
-        bar_width = 40
-        filled = int((progress_percent / 100) * bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
+        filled = int((progress_percent / 100) * _BAR_WIDTH)
+        bar = _BARS[filled]
         lines.append("")
         lines.append(f"[{color}]{bar}[/] {progress_percent:.1f}%")
         
@@ -516,31 +875,52 @@ class UIRenderer:
             padding=(1, 2)
         )
     
+    def current_signature(self) -> tuple:
+        """Tuple of every user-visible value that can change between ticks
+
+        Frames whose signature matches the previous one carry no new
+        content, so the caller can skip the render entirely.
+        """
+        pm = self.prayer_manager
+        now = pm.now()
+        next_prayer_data = pm.get_next_prayer()
+        if next_prayer_data:
+            next_name, next_time = next_prayer_data
+            countdown = pm.get_time_remaining(next_time)
+        else:
+            next_name, countdown = None, None
+        return (now.replace(microsecond=0), next_name, countdown)
+
     def create_footer(self) -> Text:
         """Create footer text"""
         return Text("Press Ctrl+C to exit", style="dim", justify="center")
     
     def render_live_view(self) -> Layout:
-        """Create complete live view layout"""
-        layout = Layout()
-        
-        layout.split_column(
-            Layout(name="header", size=9),
-            Layout(name="table", size=12),
-            Layout(name="next", size=10),
-            Layout(name="footer", size=1)
-        )
-        
-        layout["header"].update(self.create_header())
-        layout["table"].update(self.create_prayer_table())
-        
+        """Refresh and return the live view layout
+
+        The Layout skeleton (and the static footer) is built once and kept;
+        each tick only swaps in the renderables that actually change.
+        """
+        self.prayer_manager._invalidate_now()
+
+        if self._layout is None:
+            self._layout = Layout()
+            self._layout.split_column(
+                Layout(name="header", size=9),
+                Layout(name="table", size=12),
+                Layout(name="next", size=10),
+                Layout(name="footer", size=1)
+            )
+            self._layout["footer"].update(self.create_footer())
+
+        self._layout["header"].update(self.create_header())
+        self._layout["table"].update(self.create_prayer_table())
+
         next_panel = self.create_next_prayer_panel()
         if next_panel:
-            layout["next"].update(next_panel)
-        
-        layout["footer"].update(self.create_footer())
-        
-        return layout
+            self._layout["next"].update(next_panel)
+
+        return self._layout
     
     def print_today(self):
         """Print today's prayer times (static)"""
@@ -574,11 +954,22 @@ class AdhanLiveApp:
         self.prayer_manager = PrayerTimesManager(self.config)
         self.audio_player = AudioPlayer(self.config)
         self.ui = UIRenderer(self.prayer_manager)
-        self.console = Console()
+        self.console = self.ui.console
         
         self.last_played_prayer = None
         self.last_update_date = None
-    
+        self._prefetched_date = None
+
+    def prefetch_tomorrow(self):
+        """Prefetch tomorrow's prayer times in the background near midnight"""
+        tomorrow = datetime.now() + timedelta(days=1)
+        if self._prefetched_date != tomorrow.date():
+            self._prefetched_date = tomorrow.date()
+            threading.Thread(
+                target=lambda: self.prayer_manager.api.fetch_prayer_times(tomorrow),
+                daemon=True
+            ).start()
+
     def initialize(self) -> bool:
         """Initialize application and fetch prayer times"""
         self.console.print("[cyan]Fetching prayer times...[/]")
@@ -592,42 +983,74 @@ class AdhanLiveApp:
         
         return True
     
-    def check_prayer_time(self):
-        """Check if it's prayer time and play adhan"""
-        for prayer in ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']:
-            if self.prayer_manager.is_prayer_time(prayer) and prayer != self.last_played_prayer:
-                audio_file = self.config.get('audio_file')
-                self.audio_player.play(audio_file)
-                
-                title = "◈ Adhan Live"
-                message = f"It's time for {prayer} prayer!"
-                self.audio_player.send_notification(title, message)
-                
-                self.last_played_prayer = prayer
-                break
-    
-    def update_if_needed(self):
-        """Update prayer times if date changed"""
-        current_date = datetime.now().date()
-        if self.last_update_date != current_date:
-            self.prayer_manager.update()
-            self.last_update_date = current_date
-            self.last_played_prayer = None
-    
+    def fire_prayer(self, prayer: str):
+        """Play adhan and notify for a prayer whose time has arrived"""
+        audio_file = self.config.get('audio_file')
+        self.audio_player.play(audio_file)
+
+        title = "◈ Adhan Live"
+        message = f"It's time for {prayer} prayer!"
+        self.audio_player.send_notification(title, message)
+
+        self.last_played_prayer = prayer
+
+    def _seconds_until_midnight(self) -> float:
+        """Seconds from now until the start of the next day"""
+        now = self.prayer_manager.now()
+        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return max(1.0, (midnight - now).total_seconds())
+
     def run_live(self):
-        """Run live view with auto-refresh"""
+        """Run live view with event-scheduled refresh
+
+        Instead of polling prayer times every second, the loop schedules
+        three kinds of events: a 1 s tick that only refreshes the UI, one
+        exact-time event per remaining prayer, and a midnight rollover that
+        re-fetches timings and reschedules everything for the new day.
+        """
         if not self.initialize():
             return
-        
+
         self.last_update_date = datetime.now().date()
-        
+        scheduler = sched.scheduler(time.monotonic, time.sleep)
+
         try:
             with Live(self.ui.render_live_view(), refresh_per_second=1, console=self.console) as live:
-                while True:
-                    self.update_if_needed()
-                    self.check_prayer_time()
-                    live.update(self.ui.render_live_view())
-                    time.sleep(1)
+                def tick():
+                    self.prayer_manager._invalidate_now()
+                    sig = self.ui.current_signature()
+                    if sig != self.ui._last_sig:
+                        self.ui._last_sig = sig
+                        live.update(self.ui.render_live_view())
+                    scheduler.enter(1.0, 1, tick)
+
+                def schedule_prayers():
+                    now = self.prayer_manager.now()
+                    for prayer, prayer_time in self.prayer_manager.prayer_times.items():
+                        delay = (prayer_time - now).total_seconds()
+                        if delay > 0:
+                            scheduler.enter(delay, 0, self.fire_prayer, (prayer,))
+
+                def schedule_prefetch():
+                    now = self.prayer_manager.now()
+                    prefetch_at = now.replace(hour=23, minute=30, second=0, microsecond=0)
+                    delay = (prefetch_at - now).total_seconds()
+                    if delay > 0:
+                        scheduler.enter(delay, 0, self.prefetch_tomorrow)
+
+                def rollover():
+                    self.prayer_manager.update()
+                    self.last_update_date = datetime.now().date()
+                    self.last_played_prayer = None
+                    schedule_prayers()
+                    schedule_prefetch()
+                    scheduler.enter(self._seconds_until_midnight(), 0, rollover)
+
+                schedule_prayers()
+                schedule_prefetch()
+                scheduler.enter(self._seconds_until_midnight(), 0, rollover)
+                scheduler.enter(1.0, 1, tick)
+                scheduler.run()
         except KeyboardInterrupt:
             self.console.print()
             self.console.print(Panel(